@@ -0,0 +1,64 @@
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'hashtable'))
+
+from concurrent_hash_table import ConcurrentHashTable
+from hash_table_separate_chaining import HashTableSeparateChaining
+
+# Runs the same read-mostly workload (90% get, 10% put) from 1, 2, 4 and
+# 8 threads against a chaining table behind one global lock and against
+# the lock striped ConcurrentHashTable
+
+OPERATIONS = 200000
+KEYS = 50000
+THREADS = (1, 2, 4, 8)
+
+
+class GlobalLockHashTable:
+    def __init__(self):
+        self.table = HashTableSeparateChaining(0, 0.75)
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        with self.lock:
+            return self.table.get(key)
+
+    def put(self, key, value):
+        with self.lock:
+            return self.table.put(key, value)
+
+
+def worker(table, operations, seed):
+    rng = random.Random(seed)
+    for _ in range(operations):
+        key = rng.randrange(KEYS)
+        if rng.random() < 0.9:
+            table.get(key)
+        else:
+            table.put(key, key)
+
+
+def timed(table, threads, operations):
+    for key in range(KEYS):
+        table.put(key, key)
+    pool = [threading.Thread(target=worker, args=(table, operations // threads, seed)) for seed in range(threads)]
+    start = time.perf_counter()
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    operations = int(sys.argv[1]) if len(sys.argv) > 1 else OPERATIONS
+
+    print(f'{operations} operations over {KEYS} keys')
+    for threads in THREADS:
+        global_lock = timed(GlobalLockHashTable(), threads, operations)
+        striped = timed(ConcurrentHashTable(0, 0.75), threads, operations)
+        print(f'{threads} threads: global lock {global_lock:.3f}s  striped {striped:.3f}s')
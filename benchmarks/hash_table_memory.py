@@ -0,0 +1,63 @@
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'hashtable'))
+
+from hash_table_linear_probing import HashTableLinearProbing
+from hash_table_separate_chaining import HashTableSeparateChaining
+
+# Compares the separate chaining table with the linear probing table:
+# memory used per mapping (keys and values themselves excluded) and
+# the time taken by put, get and remove over the same keys
+
+N = 200000
+TABLES = (
+    ('separate chaining', HashTableSeparateChaining, 0.75),
+    ('linear probing', HashTableLinearProbing, 0.5),
+)
+
+
+def memory_per_mapping(cls, load_factor, keys):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    table = cls(0, load_factor)
+    for key in keys:
+        table.put(key, key)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / len(keys)
+
+
+def throughput(cls, load_factor, keys):
+    table = cls(0, load_factor)
+    timings = []
+
+    start = time.perf_counter()
+    for key in keys:
+        table.put(key, key)
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        table.get(key)
+    timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for key in keys:
+        table.remove(key)
+    timings.append(time.perf_counter() - start)
+    return timings
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+    keys = [f'key{i}' for i in range(1, n + 1)]
+
+    print(f'{n} string keys')
+    for name, cls, load_factor in TABLES:
+        per_mapping = memory_per_mapping(cls, load_factor, keys)
+        put, get, remove = throughput(cls, load_factor, keys)
+        print(f'{name:<18} {per_mapping:6.1f} bytes/mapping  '
+              f'put {put:.3f}s  get {get:.3f}s  remove {remove:.3f}s')
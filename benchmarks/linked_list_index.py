@@ -0,0 +1,52 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from linked_list import DoublyLinkedList
+
+# Times indexed access on DoublyLinkedList with and without the skip
+# index: get, addAt and removeAt at random indexes, plus the cost the
+# index adds to plain addLast
+
+N = 100000
+OPERATIONS = 2000
+
+
+def timed(skip_index, n, operations):
+    rng = random.Random(0)
+    ll = DoublyLinkedList(skip_index=skip_index)
+
+    start = time.perf_counter()
+    for i in range(n):
+        ll.addLast(i)
+    result = [time.perf_counter() - start]
+
+    start = time.perf_counter()
+    for _ in range(operations):
+        ll.get(rng.randrange(n))
+    result.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for i in range(operations):
+        ll.addAt(rng.randrange(ll.size()), i)
+    result.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(operations):
+        ll.removeAt(rng.randrange(ll.size()))
+    result.append(time.perf_counter() - start)
+    return result
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+    operations = int(sys.argv[2]) if len(sys.argv) > 2 else OPERATIONS
+
+    print(f'{n} elements, {operations} get, addAt and removeAt')
+    for name, skip_index in (('walk', False), ('skip index', True)):
+        add_last, get, add_at, remove_at = timed(skip_index, n, operations)
+        print(f'{name:<10} addLast {add_last:.3f}s  get {get:.3f}s  '
+              f'addAt {add_at:.3f}s  removeAt {remove_at:.3f}s')
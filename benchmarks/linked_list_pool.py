@@ -0,0 +1,82 @@
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import linked_list
+from linked_list import DoublyLinkedList, Node
+
+# Measures DoublyLinkedList nodes before and after they were slotted and
+# pooled: memory per element of a filled list, then a steady queue churn
+# (addLast + removeFirst at a constant size) timed and with the number
+# of nodes it allocates
+
+N = 200000
+CHURN = 1000000
+
+
+class DictNode(Node):
+    """
+    A node with a __dict__, like before Node had __slots__
+    """
+
+
+def memory_per_element(n):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ll = DoublyLinkedList()
+    for i in range(n):
+        ll.addLast(i)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / n
+
+
+def churn(n, rounds, pool_size):
+    ll = DoublyLinkedList(pool_size)
+    for i in range(n):
+        ll.addLast(i)
+
+    start = time.perf_counter()
+    for i in range(rounds):
+        ll.addLast(i)
+        ll.removeFirst()
+    elapsed = time.perf_counter() - start
+
+    # Same churn again, this time counting the nodes it allocates
+    node_class = linked_list.Node
+    allocated = 0
+
+    class CountingNode(node_class):
+        __slots__ = ()
+
+        def __init__(self, data, prev, next):
+            nonlocal allocated
+            allocated += 1
+            node_class.__init__(self, data, prev, next)
+
+    linked_list.Node = CountingNode
+    for i in range(rounds):
+        ll.addLast(i)
+        ll.removeFirst()
+    linked_list.Node = node_class
+    return elapsed, allocated
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else CHURN
+
+    print(f'{n} elements, {rounds} addLast + removeFirst rounds')
+    for name, node_class, pool_size in (('dict nodes', DictNode, 0),
+                                        ('slotted nodes', Node, 0),
+                                        ('slotted + pool', Node, 64)):
+        # The list builds its nodes through the module global
+        linked_list.Node = node_class
+        per_element = memory_per_element(n)
+        elapsed, allocated = churn(n, rounds, pool_size)
+        print(f'{name:<15} {per_element:6.1f} bytes/element  churn {elapsed:.3f}s  '
+              f'{allocated} nodes allocated')
+    linked_list.Node = Node
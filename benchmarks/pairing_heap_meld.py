@@ -0,0 +1,69 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pairing_heap import PairingHeap
+from priority_queue import PQueue
+
+# Merges dozens of shards into one queue, like the shard rebalancing
+# step does, comparing PQueue (poll every element of a shard and add it
+# to the target, or add_many the raw heap list) with PairingHeap.meld
+
+SHARDS = 50
+SHARD_SIZE = 2000
+
+
+def build_shards(cls, values):
+    shards = []
+    for chunk in values:
+        shard = cls()
+        for value in chunk:
+            shard.add(value)
+        shards.append(shard)
+    return shards
+
+
+def merge_poll_add(shards):
+    target = shards[0]
+    for shard in shards[1:]:
+        while not shard.is_empty():
+            target.add(shard.poll())
+    return target
+
+
+def merge_add_many(shards):
+    target = shards[0]
+    for shard in shards[1:]:
+        target.add_many(shard.heap[:shard.size()])
+        shard.clear()
+    return target
+
+
+def merge_meld(shards):
+    target = shards[0]
+    for shard in shards[1:]:
+        target.meld(shard)
+    return target
+
+
+def timed(cls, merge, values):
+    shards = build_shards(cls, values)
+    start = time.perf_counter()
+    target = merge(shards)
+    elapsed = time.perf_counter() - start
+    assert target.size() == sum(len(chunk) for chunk in values)
+    return elapsed
+
+
+if __name__ == '__main__':
+    shard_size = int(sys.argv[1]) if len(sys.argv) > 1 else SHARD_SIZE
+    random.seed(0)
+    values = [[random.random() for _ in range(shard_size)] for _ in range(SHARDS)]
+
+    print(f'{SHARDS} shards of {shard_size} elements')
+    print(f'PQueue poll/add:   {timed(PQueue, merge_poll_add, values):.4f}s')
+    print(f'PQueue add_many:   {timed(PQueue, merge_add_many, values):.4f}s')
+    print(f'PairingHeap meld:  {timed(PairingHeap, merge_meld, values):.6f}s')
@@ -0,0 +1,47 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from priority_queue import PQueue
+
+# Compares binary, 4-ary and 8-ary heaps on a push-heavy
+# trace (mostly adds, few polls) and on a pop-heavy trace
+# (the whole heap is drained after being loaded)
+
+N = 200000
+ARITIES = (2, 4, 8)
+
+
+def push_heavy(pq, values):
+    for i, value in enumerate(values):
+        pq.add(value)
+        if i % 10 == 9:
+            pq.poll()
+
+
+def pop_heavy(pq, values):
+    for value in values:
+        pq.add(value)
+    while not pq.is_empty():
+        pq.poll()
+
+
+def timed(trace, arity, values):
+    pq = PQueue(arity=arity)
+    start = time.perf_counter()
+    trace(pq, values)
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+    random.seed(0)
+    values = [random.random() for _ in range(n)]
+
+    print(f'{n} elements')
+    for trace in (push_heavy, pop_heavy):
+        for arity in ARITIES:
+            print(f'{trace.__name__:<12} arity={arity}: {timed(trace, arity, values):.3f}s')
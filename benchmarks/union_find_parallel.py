@@ -0,0 +1,55 @@
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from parallel_union_find import parallel_union_find
+from union_find import UnionFind, np
+
+# Unifies a synthetic random graph with a single process UnionFind
+# (unify_many, and unify_edges when NumPy is installed) and with
+# parallel_union_find using 1, 2, 4 and 8 workers
+
+NODES = 200000
+EDGES = 2000000
+WORKERS = (1, 2, 4, 8)
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def single_process(size, p, q):
+    uf = UnionFind(size)
+    uf.unify_many(zip(p, q))
+    return uf
+
+
+def single_process_vectorized(size, p, q):
+    uf = UnionFind(size)
+    uf.unify_edges(np.array(p, dtype=np.intc), np.array(q, dtype=np.intc))
+    return uf
+
+
+if __name__ == '__main__':
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else NODES
+    edges = int(sys.argv[2]) if len(sys.argv) > 2 else EDGES
+    random.seed(0)
+    p = [random.randrange(nodes) for _ in range(edges)]
+    q = [random.randrange(nodes) for _ in range(edges)]
+
+    print(f'{nodes} nodes, {edges} edges, {os.cpu_count()} cpus')
+    baseline, expected = timed(single_process, nodes, p, q)
+    print(f'single process: {baseline:.3f}s')
+    if np is not None:
+        elapsed, _ = timed(single_process_vectorized, nodes, p, q)
+        print(f'single process unify_edges: {elapsed:.3f}s')
+
+    for workers in WORKERS:
+        elapsed, uf = timed(parallel_union_find, nodes, p, q, workers)
+        assert uf.components() == expected.components()
+        print(f'{workers} workers: {elapsed:.3f}s (speedup {baseline / elapsed:.2f}x)')
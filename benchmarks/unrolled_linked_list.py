@@ -0,0 +1,72 @@
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from linked_list import DoublyLinkedList
+from unrolled_linked_list import UnrolledLinkedList
+
+# Compares DoublyLinkedList with UnrolledLinkedList over the same
+# elements: memory per element, a full scan, indexOf lookups and
+# removeAt at random indexes
+
+N = 200000
+LOOKUPS = 200
+LISTS = (
+    ('doubly linked', DoublyLinkedList),
+    ('unrolled', UnrolledLinkedList),
+)
+
+
+def filled(cls, n):
+    ll = cls()
+    for i in range(n):
+        ll.addLast(i)
+    return ll
+
+
+def memory_per_element(cls, n):
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    ll = filled(cls, n)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del ll
+    return (after - before) / n
+
+
+def timings(cls, n, lookups):
+    ll = filled(cls, n)
+    rng = random.Random(0)
+    result = []
+
+    start = time.perf_counter()
+    for _ in ll:
+        pass
+    result.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(lookups):
+        ll.indexOf(rng.randrange(n))
+    result.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(lookups):
+        ll.removeAt(rng.randrange(ll.size()))
+    result.append(time.perf_counter() - start)
+    return result
+
+
+if __name__ == '__main__':
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else N
+    lookups = int(sys.argv[2]) if len(sys.argv) > 2 else LOOKUPS
+
+    print(f'{n} elements, {lookups} indexOf and removeAt')
+    for name, cls in LISTS:
+        per_element = memory_per_element(cls, n)
+        scan, index_of, remove_at = timings(cls, n, lookups)
+        print(f'{name:<14} {per_element:6.1f} bytes/element  '
+              f'scan {scan:.3f}s  indexOf {index_of:.3f}s  removeAt {remove_at:.3f}s')
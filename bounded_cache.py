@@ -0,0 +1,271 @@
+import time
+
+from hashtable.hash_table_separate_chaining import DEFAULT_LOAD_FACTOR, HashTableSeparateChaining
+from linked_list import DoublyLinkedList
+
+
+class CacheEntry:
+    """
+    Internal record kept in the hash table for every cached key
+    """
+    __slots__ = ('value', 'node', 'frequency', 'expires', 'expiryNode')
+
+    def __init__(self, value, node, frequency, expires):
+        self.value = value
+        self.node = node  # Handle of the key inside its linked list, unlinked in O(1)
+        self.frequency = frequency  # Number of times the key was used, for LFU
+        self.expires = expires  # Clock time after which the entry is stale, None if it never expires
+        self.expiryNode = None  # Handle of the key inside the expiry list when there is a ttl
+
+
+class BoundedCache:
+    """
+    A cache holding at most 'capacity' keys. The hash table maps every key
+    to the handle of its node in a linked list ordered by recency, so moving
+    a key to the most recent end and evicting the least recent one are O(1).
+    With the LRU policy the least recently used key is evicted, with LFU the
+    least frequently used one (the least recent among ties). With a ttl
+    entries also expire 'ttl' seconds after they were put. Expired entries
+    are purged before anything is evicted and are not counted in the size
+    """
+    def __init__(self, capacity, policy='LRU', ttl=None, clock=time.monotonic):
+        if capacity <= 0:
+            raise Exception('Illegal capacity')
+        if policy not in ('LRU', 'LFU'):
+            raise Exception(f'Unknown eviction policy {policy}')
+        if ttl is not None and ttl <= 0:
+            raise Exception('Illegal ttl')
+        self.capacity = capacity
+        self.policy = policy
+        self.ttl = ttl
+        self.clock = clock
+
+        self.table = HashTableSeparateChaining(capacity, DEFAULT_LOAD_FACTOR)  # Maps keys to their CacheEntry
+        self.recency = DoublyLinkedList()  # LRU: keys from least to most recently used
+        self.frequencies = HashTableSeparateChaining(0, DEFAULT_LOAD_FACTOR)  # LFU: use count -> list like recency
+        self.minFrequency = 0  # LFU: lowest use count among the cached keys
+        # ttl: keys from the first to the last to expire. Every put gives its key the
+        # same ttl, so moving it to the end keeps the list ordered by expiry time
+        self.expiry = DoublyLinkedList()
+
+        # Counters for monitoring
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def __len__(self):
+        """
+        Return the number of cached keys that did not expire
+        """
+        return self.size()
+
+    def size(self):
+        """
+        Return the number of cached keys that did not expire
+        """
+        self.purge()
+        return self.table.size
+
+    def is_empty(self):
+        """
+        Is this cache empty?
+        """
+        return self.size() == 0
+
+    def clear(self):
+        """
+        Remove every key, the counters are kept
+        """
+        self.table.clear()
+        self.recency.clear()
+        self.frequencies.clear()
+        self.expiry.clear()
+        self.minFrequency = 0
+
+    def stats(self):
+        """
+        Return the counters of the cache
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+        }
+
+    def contains(self, key):
+        """
+        Check if a key is cached and not expired, without counting it as a use
+        """
+        entry = self.table.get(key)
+        return entry is not None and not self.expired(entry)
+
+    def get(self, key, default=None):
+        """
+        Return the value of a key and mark it as used, 'default' on a miss, O(1)
+        """
+        entry = self.table.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+        if self.expired(entry):
+            self.discard(key, entry)
+            self.expirations += 1
+            self.misses += 1
+            return default
+
+        self.hits += 1
+        self.touch(key, entry)
+        return entry.value
+
+    def put(self, key, value):
+        """
+        Cache a value, evicting a key first if the cache is full, amortized O(1)
+        """
+        if key is None:
+            raise Exception('Null key')
+        expires = None if self.ttl is None else self.clock() + self.ttl
+        entry = self.table.get(key)
+        if entry is not None:
+            entry.value = value
+            entry.expires = expires
+            if expires is not None:
+                self.expiry.move_to_back(entry.expiryNode)
+            self.touch(key, entry)
+            return
+
+        self.purge()
+        if self.table.size >= self.capacity:
+            self.evict()
+
+        entry = CacheEntry(value, None, 1, expires)
+        self.link(key, entry)
+        if expires is not None:
+            entry.expiryNode = self.expiry.addLast(key)
+        self.minFrequency = 1
+        self.table.put(key, entry)
+
+    def remove(self, key):
+        """
+        Remove a key and return its value, None if it was not cached
+        """
+        entry = self.table.get(key)
+        if entry is None:
+            return None
+        self.discard(key, entry)
+        return entry.value
+
+    def purge(self):
+        """
+        Remove every expired key, amortized O(1) since each key is removed once
+        """
+        if self.ttl is None:
+            return
+        now = self.clock()
+        while not self.expiry.is_empty():
+            key = self.expiry.peekFirst()
+            entry = self.table.get(key)
+            if entry.expires > now:
+                break
+            self.discard(key, entry)
+            self.expirations += 1
+
+    def expired(self, entry):
+        """
+        Check if an entry outlived its ttl
+        """
+        return entry.expires is not None and entry.expires <= self.clock()
+
+    def keys_of(self, frequency):
+        """
+        Return the list holding the keys of a given use count (the recency
+        list for LRU), creating it if needed
+        """
+        if self.policy == 'LRU':
+            return self.recency
+        keys = self.frequencies.get(frequency)
+        if keys is None:
+            keys = DoublyLinkedList()
+            self.frequencies.put(frequency, keys)
+        return keys
+
+    def link(self, key, entry):
+        """
+        Append a key at the most recent end of its list and keep its node handle
+        """
+        entry.node = self.keys_of(entry.frequency).addLast(key)
+
+    def unlink(self, entry):
+        """
+        Remove the node of an entry from its list, O(1)
+        """
+        keys = self.keys_of(entry.frequency)
+        keys.remove_node(entry.node)
+        entry.node = None
+
+        if self.policy == 'LFU' and keys.is_empty():
+            self.frequencies.remove(entry.frequency)
+
+    def touch(self, key, entry):
+        """
+        Mark a key as just used
+        """
+        self.unlink(entry)
+        if self.minFrequency == entry.frequency and not self.frequencies.has_key(entry.frequency):
+            self.minFrequency += 1
+        entry.frequency += 1
+        self.link(key, entry)
+
+    def discard(self, key, entry):
+        """
+        Remove a key from the lists and the table
+        """
+        self.unlink(entry)
+        if entry.expiryNode is not None:
+            self.expiry.remove_node(entry.expiryNode)
+            entry.expiryNode = None
+        self.table.remove(key)
+
+    def evict(self):
+        """
+        Remove the key chosen by the eviction policy
+        """
+        # Removed or expired keys may have emptied the lowest use count
+        if self.policy == 'LFU' and not self.frequencies.has_key(self.minFrequency):
+            self.minFrequency = min(self.frequencies.keys())
+
+        keys = self.keys_of(self.minFrequency)
+        key = keys.peekFirst()
+        entry = self.table.get(key)
+        if self.expired(entry):
+            self.expirations += 1
+        else:
+            self.evictions += 1
+        self.discard(key, entry)
+
+    def __repr__(self):
+        return self.table.__repr__()
+
+
+if __name__ == '__main__':
+    cache = BoundedCache(2)
+
+    cache.put('Dyogo', 1)
+    cache.put('Nikoly', 2)
+    cache.get('Dyogo')
+    cache.put('Jimenez', 3)  # evicts Nikoly, the least recently used
+
+    print(cache.contains('Nikoly'))
+    print(cache.stats())
+
+    frequentes = BoundedCache(2, policy='LFU')
+
+    frequentes.put('a', 1)
+    frequentes.put('b', 2)
+    frequentes.get('a')
+    frequentes.get('a')
+    frequentes.get('b')
+    frequentes.put('c', 3)  # evicts b, used less often than a
+
+    print(frequentes.contains('b'), frequentes.contains('a'))
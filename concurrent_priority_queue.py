@@ -0,0 +1,211 @@
+import asyncio
+import threading
+from collections import deque
+
+from priority_queue import PQueue
+
+
+class ThreadSafePQueue(object):
+    """
+    A priority queue that can be shared between threads.
+    Consumers calling poll sleep until a producer adds an
+    element instead of spinning on is_empty
+    """
+    def __init__(self, pq=None):
+        self.pq = PQueue() if pq is None else pq  # The wrapped priority queue
+        self.lock = threading.Lock()
+        self.notEmpty = threading.Condition(self.lock)  # Signaled whenever elements are added
+
+    def size(self):
+        """
+        Return the size of the priority queue
+        """
+        with self.lock:
+            return self.pq.size()
+
+    def is_empty(self):
+        """
+        Return whether or not the priority queue is empty
+        """
+        with self.lock:
+            return self.pq.is_empty()
+
+    def clear(self):
+        """
+        Remove every element of the priority queue
+        """
+        with self.lock:
+            self.pq.clear()
+
+    def peek(self):
+        """
+        Return the element with the lowest priority without removing it,
+        None if the priority queue is empty
+        """
+        with self.lock:
+            return self.pq.peek()
+
+    def contains(self, elem):
+        """
+        Check if an element is inside the priority queue
+        """
+        with self.lock:
+            return self.pq.contains(elem)
+
+    def remove(self, elem):
+        """
+        Remove a particular element from the priority queue
+        """
+        with self.lock:
+            return self.pq.remove(elem)
+
+    def add(self, elem):
+        """
+        Add an element and wake up one waiting consumer
+        """
+        with self.notEmpty:
+            self.pq.add(elem)
+            self.notEmpty.notify()
+
+    def add_many(self, elems):
+        """
+        Add a batch of elements and wake up as many waiting consumers
+        """
+        elems = list(elems)
+        with self.notEmpty:
+            self.pq.add_many(elems)
+            self.notEmpty.notify(len(elems))
+
+    def poll(self, timeout=None):
+        """
+        Remove and return the element with the lowest priority. If the
+        priority queue is empty wait until an element is added, for at
+        most 'timeout' seconds (forever if timeout is None).
+        Return None if the timeout expires
+        """
+        with self.notEmpty:
+            if not self.notEmpty.wait_for(lambda: not self.pq.is_empty(), timeout):
+                return None
+            return self.pq.poll()
+
+    def __repr__(self):
+        with self.lock:
+            return self.pq.__repr__()
+
+
+class AsyncPQueue(object):
+    """
+    A priority queue for asyncio code. Consumers await poll until
+    an element is added. Like asyncio.Queue it is not thread safe,
+    every method must be called from the event loop thread
+    """
+    def __init__(self, pq=None):
+        self.pq = PQueue() if pq is None else pq  # The wrapped priority queue
+        self.waiters = deque()  # Futures of the consumers waiting for an element
+
+    def size(self):
+        """
+        Return the size of the priority queue
+        """
+        return self.pq.size()
+
+    def is_empty(self):
+        """
+        Return whether or not the priority queue is empty
+        """
+        return self.pq.is_empty()
+
+    def peek(self):
+        """
+        Return the element with the lowest priority without removing it,
+        None if the priority queue is empty
+        """
+        return self.pq.peek()
+
+    def add(self, elem):
+        """
+        Add an element and wake up one waiting consumer
+        """
+        self.pq.add(elem)
+        self.wake_up_next()
+
+    def add_many(self, elems):
+        """
+        Add a batch of elements and wake up as many waiting consumers
+        """
+        elems = list(elems)
+        self.pq.add_many(elems)
+        for _ in range(len(elems)):
+            self.wake_up_next()
+
+    def poll_nowait(self):
+        """
+        Remove and return the element with the lowest priority,
+        None if the priority queue is empty
+        """
+        return self.pq.poll()
+
+    async def poll(self):
+        """
+        Remove and return the element with the lowest priority,
+        waiting until an element is added if the priority queue is empty
+        """
+        while self.pq.is_empty():
+            waiter = asyncio.get_running_loop().create_future()
+            self.waiters.append(waiter)
+            try:
+                await waiter
+            except BaseException:
+                waiter.cancel()
+                if waiter in self.waiters:
+                    self.waiters.remove(waiter)
+
+                # We were woken up but got cancelled, hand the
+                # element over to the next waiting consumer
+                if not self.pq.is_empty() and not waiter.cancelled():
+                    self.wake_up_next()
+                raise
+        return self.pq.poll()
+
+    def wake_up_next(self):
+        """
+        Wake up the first consumer still waiting for an element
+        """
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    def __repr__(self):
+        return self.pq.__repr__()
+
+
+if __name__ == '__main__':
+    compartilhada = ThreadSafePQueue()
+    resultados = []
+
+    def consumidor():
+        for _ in range(3):
+            resultados.append(compartilhada.poll(timeout=1))
+
+    thread = threading.Thread(target=consumidor)
+    thread.start()
+
+    compartilhada.add(5)
+    compartilhada.add_many([2, 9])
+
+    thread.join()
+    print(resultados)
+    print(compartilhada.poll(timeout=0.1))
+
+    async def main():
+        fila = AsyncPQueue()
+        consumidores = [asyncio.ensure_future(fila.poll()) for _ in range(2)]
+        await asyncio.sleep(0)
+
+        fila.add_many(['Nikoly', 'Dyogo'])
+
+        print(await asyncio.gather(*consumidores))
+
+    asyncio.run(main())
@@ -0,0 +1,158 @@
+import threading
+
+from hash_table_separate_chaining import DEFAULT_CAPACITY, DEFAULT_LOAD_FACTOR, HashTableSeparateChaining, fibonacci_mix
+
+DEFAULT_STRIPES = 16
+
+
+# A hash table that can be shared between threads. The keys are split into
+# stripes by hash and every stripe is a HashTableSeparateChaining guarded by
+# its own lock, so threads working on different stripes never wait for each
+# other. A stripe resizes on its own and incrementally (every operation moves
+# a few buckets), so a resize only holds its stripe lock for short steps
+# and readers are never blocked for the whole rehash
+class ConcurrentHashTable:
+    # Every stripe shares the same hash and mix functions, so a key is
+    # hashed once to pick both its stripe and its bucket
+    def __init__(self, capacity, maxLoadFactor, stripes=DEFAULT_STRIPES, hash_function=hash, mix=fibonacci_mix):
+        if capacity < 0:
+            raise Exception('Illegal capacity')
+        if stripes <= 0:
+            raise Exception('Illegal number of stripes')
+        self.hash_function = hash_function
+        self.mix = mix
+        stripe_capacity = max(DEFAULT_CAPACITY, -(-capacity // stripes))
+        self.stripes = [HashTableSeparateChaining(stripe_capacity, maxLoadFactor, hash_function, self.mix)
+                        for _ in range(stripes)]
+        self.locks = [threading.Lock() for _ in range(stripes)]
+
+    # Computes the hash of a key the way every stripe does
+    def hash_key(self, key):
+        return self.stripes[0].hash_key(key)
+
+    # Picks the stripe of a hash from the top bits of a second mix. The tables
+    # inside the stripes pick a bucket from the low bits of the hash, so a
+    # stripe chosen from those bits would leave each stripe a few buckets.
+    # The second mix also spreads hashes whose top bits are all zero, as with
+    # identity_mix
+    def stripe_index(self, keyHash):
+        return (fibonacci_mix(keyHash) >> 48) % len(self.stripes)
+
+    # Returns the number of elements currently inside the hash-table
+    def __len__(self):
+        total = 0
+        for stripe, lock in zip(self.stripes, self.locks):
+            with lock:
+                total += stripe.size
+        return total
+
+    def size(self):
+        return len(self)
+
+    # Returns true/false depending on whether the hash-table is empty
+    def is_empty(self):
+        return len(self) == 0
+
+    # Clears all the contents of the hash-table, one stripe at a time
+    def clear(self):
+        for stripe, lock in zip(self.stripes, self.locks):
+            with lock:
+                stripe.clear()
+
+    # Returns true/false depending on whether a key is in the hash table
+    def contains_key(self, key):
+        return self.has_key(key)
+
+    def has_key(self, key):
+        key_hash = self.hash_key(key)
+        i = self.stripe_index(key_hash)
+        with self.locks[i]:
+            return self.stripes[i].has_key(key, key_hash)
+
+    # Insert, put and add all place a value in the hash-table
+    def put(self, key, value):
+        return self.insert(key, value)
+
+    def add(self, key, value):
+        return self.insert(key, value)
+
+    def insert(self, key, value):
+        if key is None:
+            raise Exception('Null key')
+        key_hash = self.hash_key(key)
+        i = self.stripe_index(key_hash)
+        with self.locks[i]:
+            return self.stripes[i].insert(key, value, key_hash)
+
+    # Gets a key's value from the map, None if the key does not exist
+    def get(self, key):
+        if key is None:
+            return None
+        key_hash = self.hash_key(key)
+        i = self.stripe_index(key_hash)
+        with self.locks[i]:
+            return self.stripes[i].get(key, key_hash)
+
+    # Removes a key from the map and returns the value, None if the key does not exist
+    def remove(self, key):
+        if key is None:
+            return None
+        key_hash = self.hash_key(key)
+        i = self.stripe_index(key_hash)
+        with self.locks[i]:
+            return self.stripes[i].remove(key, key_hash)
+
+    # Atomically replaces the value of a key with function(old value), where
+    # the old value is None if the key does not exist. Returns the new value
+    def compute(self, key, function):
+        if key is None:
+            raise Exception('Null key')
+        key_hash = self.hash_key(key)
+        i = self.stripe_index(key_hash)
+        with self.locks[i]:
+            stripe = self.stripes[i]
+            value = function(stripe.get(key, key_hash))
+            stripe.insert(key, value, key_hash)
+            return value
+
+    # Returns the (key, value) pairs of the hash table. Each stripe is read
+    # under its lock, so the result is consistent per stripe only
+    def items(self):
+        items = []
+        for stripe, lock in zip(self.stripes, self.locks):
+            with lock:
+                items.extend(stripe.items())
+        return items
+
+    # Returns the list of keys found within the hash table
+    def keys(self):
+        return [key for key, _ in self.items()]
+
+    # Returns the list of values found within the hash table
+    def values(self):
+        return [value for _, value in self.items()]
+
+    def __repr__(self):
+        sb = '{'
+        for key, value in self.items():
+            sb += f'{key} => {value}, '
+        sb += '}'
+        return str(sb)
+
+
+if __name__ == '__main__':
+    hash_table = ConcurrentHashTable(DEFAULT_CAPACITY, DEFAULT_LOAD_FACTOR)
+
+    def contar(palavras):
+        for palavra in palavras:
+            hash_table.compute(palavra, lambda total: 1 if total is None else total + 1)
+
+    threads = [threading.Thread(target=contar, args=(['Dyogo', 'Nikoly', 'Jimenez'] * 1000,)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    print(hash_table.get('Dyogo'))
+    print(hash_table.remove('Nikoly'))
+    print(hash_table)
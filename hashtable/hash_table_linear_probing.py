@@ -0,0 +1,214 @@
+from array import array
+
+from hash_table_separate_chaining import MASK_64, RANDOMIZED_TYPES, fibonacci_mix
+
+DEFAULT_CAPACITY = 8
+DEFAULT_LOAD_FACTOR = 0.5
+
+
+# Marker left in the slot of a removed key so that probing
+# goes on past it instead of stopping as on an empty slot
+class Tombstone:
+    def __repr__(self):
+        return 'TOMBSTONE'
+
+
+TOMBSTONE = Tombstone()
+
+
+# An open addressing hash table using linear probing. Instead of an
+# entry object and a bucket list per key, the hashes, keys and values
+# live in three parallel flat arrays with one slot per position.
+# Probing starts at the low bits of the hash, so the hash of every key
+# goes through a mix first (see hash_table_separate_chaining): without
+# it strided int keys would all start at the same slot and pile up
+class HashTableLinearProbing:
+    def __init__(self, capacity, maxLoadFactor, mix=fibonacci_mix):
+        if capacity < 0:
+            raise Exception('Illegal capacity')
+        if not 0 < maxLoadFactor < 1:
+            raise Exception('Illegal maxLoadFactor')
+        self.size = 0  # Number of keys currently inside the hash-table
+        self.usedSlots = 0  # Number of keys plus tombstones, probing chains only end on free slots
+        self.maxLoadFactor = maxLoadFactor
+        self.mix = mix
+
+        # The capacity is kept a power of two so an index is found with a mask
+        self.capacity = DEFAULT_CAPACITY
+        while self.capacity < capacity:
+            self.capacity *= 2
+        self.allocate(self.capacity)
+
+    # Creates empty slot arrays with the given capacity
+    def allocate(self, capacity):
+        self.capacity = capacity
+        self.threshold = int(capacity * self.maxLoadFactor)
+        self.hashes = array('Q', [0]) * capacity  # Mixed hash of the key in each slot
+        self.slotKeys = [None] * capacity  # Key in each slot, None if free or TOMBSTONE if removed
+        self.slotValues = [None] * capacity  # Value in each slot
+
+    # Returns the number of keys inside the hash-table
+    def __len__(self):
+        return self.size
+
+    # Returns true/false depending on whether the hash-table is empty
+    def is_empty(self):
+        return self.size == 0
+
+    # Clears all the contents of the hash-table
+    def clear(self):
+        self.allocate(self.capacity)
+        self.size = 0
+        self.usedSlots = 0
+
+    # Computes the hash of a key as stored in the slots, an unsigned
+    # 64 bit value. str and bytes hashes are already randomized by Python
+    def hash_key(self, key):
+        keyHash = hash(key)
+        if type(key) in RANDOMIZED_TYPES:
+            return keyHash & MASK_64
+        return self.mix(keyHash) & MASK_64
+
+    def contains_key(self, key):
+        return self.has_key(key)
+
+    # Returns true/false depending on whether a key is in the hash table
+    def has_key(self, key):
+        if key is None:
+            return False
+        return self.seek(key, self.hash_key(key)) >= 0
+
+    def put(self, key, value):
+        return self.insert(key, value)
+
+    def add(self, key, value):
+        return self.insert(key, value)
+
+    # Places a key-value pair in the hash-table, returns the previous
+    # value of the key or None if the key was not present
+    def insert(self, key, value):
+        if key is None:
+            raise Exception('Null key')
+        key_hash = self.hash_key(key)
+        hashes = self.hashes
+        keys = self.slotKeys
+        mask = self.capacity - 1
+        i = key_hash & mask
+        free = -1  # First tombstone found on the way, reused for a new key
+
+        while True:
+            k = keys[i]
+            if k is None:
+                break
+            if k is TOMBSTONE:
+                if free < 0:
+                    free = i
+            elif hashes[i] == key_hash and (k is key or k == key):
+                old_value = self.slotValues[i]
+                self.slotValues[i] = value
+                return old_value
+            i = (i + 1) & mask
+
+        if free < 0:
+            free = i
+            self.usedSlots += 1
+        hashes[free] = key_hash
+        keys[free] = key
+        self.slotValues[free] = value
+        self.size += 1
+
+        if self.usedSlots > self.threshold:
+            self.resizeTable()
+        return None
+
+    # Returns the value of a key, None if the key is not present
+    def get(self, key):
+        if key is None:
+            return None
+        i = self.seek(key, self.hash_key(key))
+        if i < 0:
+            return None
+        return self.slotValues[i]
+
+    # Removes a key from the map and returns its value, None if the key is not present
+    def remove(self, key):
+        if key is None:
+            return None
+        i = self.seek(key, self.hash_key(key))
+        if i < 0:
+            return None
+        value = self.slotValues[i]
+        self.slotKeys[i] = TOMBSTONE
+        self.slotValues[i] = None
+        self.size -= 1
+        return value
+
+    # Returns the slot holding a key, -1 if it is not present
+    def seek(self, key, key_hash):
+        hashes = self.hashes
+        keys = self.slotKeys
+        mask = self.capacity - 1
+        i = key_hash & mask
+
+        while True:
+            k = keys[i]
+            if k is None:
+                return -1
+            if hashes[i] == key_hash and k is not TOMBSTONE and (k is key or k == key):
+                return i
+            i = (i + 1) & mask
+
+    # Rebuilds the slot arrays without tombstones, doubling the
+    # capacity unless most used slots were only tombstones
+    def resizeTable(self):
+        hashes, keys, values = self.hashes, self.slotKeys, self.slotValues
+        capacity = self.capacity * 2 if self.size * 2 > self.threshold else self.capacity
+        self.allocate(capacity)
+        self.usedSlots = self.size
+
+        new_hashes, new_keys, new_values = self.hashes, self.slotKeys, self.slotValues
+        mask = capacity - 1
+        for key_hash, key, value in zip(hashes, keys, values):
+            if key is None or key is TOMBSTONE:
+                continue
+            i = key_hash & mask
+            while new_keys[i] is not None:
+                i = (i + 1) & mask
+            new_hashes[i] = key_hash
+            new_keys[i] = key
+            new_values[i] = value
+
+    # Returns the list of keys found within the hash table
+    def keys(self):
+        return [key for key in self.slotKeys if key is not None and key is not TOMBSTONE]
+
+    # Returns the list of values found within the hash table
+    def values(self):
+        return [value for key, value in zip(self.slotKeys, self.slotValues) if key is not None and key is not TOMBSTONE]
+
+    def __repr__(self):
+        sb = '{'
+        for key, value in zip(self.slotKeys, self.slotValues):
+            if key is not None and key is not TOMBSTONE:
+                sb += f'{key} => {value}, '
+        sb += '}'
+        return str(sb)
+
+
+if __name__ == '__main__':
+    hash_table = HashTableLinearProbing(DEFAULT_CAPACITY, DEFAULT_LOAD_FACTOR)
+
+    hash_table.add('Bobo', 'Jimenez')
+    hash_table.add('Linda', 'Nikoly')
+    hash_table.add('Cheiroso', 'Dyogo')
+    hash_table.add('Otaku', 'Sarah')
+    hash_table.add('Gatinho', 'Gabriel')
+
+    print(hash_table.remove('Bobo'))
+    print(hash_table.is_empty())
+    print(hash_table.get('Otaku'))
+    print(hash_table.keys())
+    print(hash_table.values())
+    print(hash_table.has_key('Cheiroso'))
+
+    print(hash_table)
@@ -1,18 +1,72 @@
 DEFAULT_CAPACITY = 3
 DEFAULT_LOAD_FACTOR = 0.75
+REHASH_STEP = 8  # Number of old buckets moved to the new table by each operation during a resize
+MASK_64 = 0xFFFFFFFFFFFFFFFF
+RANDOMIZED_TYPES = frozenset((str, bytes))  # Types whose built in hash Python randomizes per process
+
+
+# Mixing functions scramble the hash of a key before its low bits pick a bucket.
+# Without mixing, integer keys hash to themselves and keys with a regular
+# stride all land in the same few buckets
+
+# Leaves the hash untouched
+def identity_mix(keyHash):
+    return keyHash
+
+
+# Fibonacci hashing: one multiply by 2^64 / golden ratio. The high half
+# of the hash is folded into the low half first and the high half of the
+# product back into its low half after, so the low bits used by the mask
+# depend on every bit of the hash. Cheap enough for every operation, it
+# is the default mix
+def fibonacci_mix(keyHash):
+    keyHash &= MASK_64
+    keyHash ^= keyHash >> 32
+    keyHash = (keyHash * 0x9E3779B97F4A7C15) & MASK_64
+    return keyHash ^ (keyHash >> 32)
+
+
+# The 64 bit finalizer of MurmurHash3, every input bit affects every output bit
+def murmur_mix(keyHash):
+    keyHash &= MASK_64
+    keyHash ^= keyHash >> 33
+    keyHash = (keyHash * 0xFF51AFD7ED558CCD) & MASK_64
+    keyHash ^= keyHash >> 33
+    keyHash = (keyHash * 0xC4CEB9FE1A85EC53) & MASK_64
+    keyHash ^= keyHash >> 33
+    return keyHash
+
+
+# Returns a murmur mix keyed with a secret seed. Without knowing the seed
+# nobody can choose keys that collide on purpose (hash flooding). str and
+# bytes hashes are already randomized per process by Python, this is for
+# tables taking int (or tuple) keys from untrusted input, e.g.
+# HashTableSeparateChaining(0, 0.75, mix=seeded_mix(random.getrandbits(64)))
+def seeded_mix(seed):
+    def mix(keyHash):
+        return murmur_mix(keyHash ^ seed)
+    return mix
+
+
+# Returns the smallest power of two >= capacity
+def power_of_two(capacity):
+    return 1 << max(0, capacity - 1).bit_length()
 
 
 class Entry:
-    def __init__(self, key, value):
+    # Entries have no per-instance __dict__, only these three fields
+    __slots__ = ('value', 'key', 'hash')
+
+    def __init__(self, key, value, key_hash=None):
         self.value = value
         self.key = key
-        self.hash = hash(key)
+        self.hash = hash(key) if key_hash is None else key_hash
 
     #  // We are not overriding the Object equals method
     #   // No casting is required with this method.
 
     def equals(self, other):
-        if hash != other.hash:
+        if self.hash != other.hash:
             return False
         else:
             return self.key == other.key  # return self.key.equals(other.key)
@@ -22,16 +76,28 @@ class Entry:
 
 
 class HashTableSeparateChaining:
-    def __init__(self, capacity, maxLoadFactor):
+    # hash_function computes the hash of a key and mix scrambles it
+    def __init__(self, capacity, maxLoadFactor, hash_function=hash, mix=fibonacci_mix):
         if capacity < 0:
             raise Exception('Illegal capacity')
         if maxLoadFactor <= 0:
             raise Exception('Illegal maxLoadFactor')
         self.size = 0
         self.maxLoadFactor = maxLoadFactor
-        self.capacity = max(DEFAULT_CAPACITY, capacity)
+        self.hash_function = hash_function
+        self.mix = mix
+
+        # The capacity is kept a power of two so a bucket is picked with a mask
+        self.capacity = power_of_two(max(DEFAULT_CAPACITY, capacity))
+        self.minCapacity = self.capacity  # The table never shrinks below its initial capacity
         self.threshold = int(self.capacity * self.maxLoadFactor)
-        self.table = [[], [], []]
+        self.table = [None] * self.capacity  # Buckets are created when the first entry lands in them
+
+        # While resizing, the entries are moved from the old table
+        # a few buckets at a time instead of all at once
+        self.oldTable = None
+        self.oldCapacity = 0
+        self.rehashIndex = 0  # Buckets of the old table below this index were already moved
 
     # Returns the number of elements currently inside the hash-table
     def size(self):
@@ -41,46 +107,69 @@ class HashTableSeparateChaining:
     def is_empty(self):
         return self.size == 0
 
-    # // Converts a hash value to an index. Essentially, this strips the
-    #   // negative sign and places the hash value in the domain [0, capacity)
+    # Computes the hash of a key as stored in the entries: the hash
+    # function of the table followed by its mixing function. Python
+    # already scrambles the built in hash of str and bytes (SipHash with
+    # a random key per process), so those skip the mix
+    def hash_key(self, key):
+        keyHash = self.hash_function(key)
+        if self.hash_function is hash and type(key) in RANDOMIZED_TYPES:
+            return keyHash
+        return self.mix(keyHash)
+
+    # Converts a hash value to an index in the domain [0, capacity) by
+    # keeping its low bits, the capacity being a power of two
     def normalizeIndex(self, keyHash):
-        return (keyHash & 0x7FFFFFFF) % self.capacity
+        return keyHash & (self.capacity - 1)
 
     # Clears all the contents of the hash-table
     def clear(self):
-        self.table = [None * self.capacity]
+        self.table = [None] * self.capacity
+        self.oldTable = None
         self.size = 0
 
-    # Returns true/false depending on whether a key is in the hash table
-    def contains_key(self, key):
-        return self.has_key(key)
+    # Returns true/false depending on whether a key is in the hash table.
+    # Every lookup accepts the hash of the key when the caller already
+    # computed it (it must be equal to hash_key(key)), so large keys are
+    # only hashed once
+    def contains_key(self, key, key_hash=None):
+        return self.has_key(key, key_hash)
 
-    def has_key(self, key):
-        bucket_index = self.normalizeIndex(hash(key))
-        return self.bucket_seek_entry(bucket_index, key) is not None
+    def has_key(self, key, key_hash=None):
+        if key_hash is None:
+            key_hash = self.hash_key(key)
+        self.migrate(key_hash)
+        bucket_index = self.normalizeIndex(key_hash)
+        return self.bucket_seek_entry(bucket_index, key, key_hash) is not None
 
     # Insert, put and add all place a value in the hash-table
-    def put(self, key, value):
-        return self.insert(key, value)
+    def put(self, key, value, key_hash=None):
+        return self.insert(key, value, key_hash)
 
-    def add(self, key, value):
-        return self.insert(key, value)
+    def add(self, key, value, key_hash=None):
+        return self.insert(key, value, key_hash)
 
-    def insert(self, key, value):
+    def insert(self, key, value, key_hash=None):
         if key is None:
             raise Exception('Null key')
-        new_entry = Entry(key, value)
+        if key_hash is None:
+            key_hash = self.hash_key(key)
+        new_entry = Entry(key, value, key_hash)
+        self.migrate(new_entry.hash)
         bucket_index = self.normalizeIndex(new_entry.hash)
         return self.bucket_insert_entry(bucket_index, new_entry)
 
     #  // Gets a key's values from the map and returns the value.
     #   // NOTE: returns null if the value is null AND also returns
     #   // null if the key does not exists, so watch out..
-    def get(self, key):
+    def get(self, key, key_hash=None):
         if key is None:
             return None
-        bucket_index = self.normalizeIndex(hash(key))
-        entry = self.bucket_seek_entry(bucket_index, key)
+        if key_hash is None:
+            key_hash = self.hash_key(key)
+        self.migrate(key_hash)
+        bucket_index = self.normalizeIndex(key_hash)
+        entry = self.bucket_seek_entry(bucket_index, key, key_hash)
         if entry is not None:
             return entry.value
         return None
@@ -88,32 +177,84 @@ class HashTableSeparateChaining:
     # // Removes a key from the map and returns the value.
     #   // NOTE: returns null if the value is null AND also returns
     #   // null if the key does not exists.
-    def remove(self, key):
+    def remove(self, key, key_hash=None):
         if key is None:
             return None
-        bucket_index = self.normalizeIndex(hash(key))
-        return self.bucket_remove_entry(bucket_index, key)
+        if key_hash is None:
+            key_hash = self.hash_key(key)
+        self.migrate(key_hash)
+        bucket_index = self.normalizeIndex(key_hash)
+        return self.bucket_remove_entry(bucket_index, key, key_hash)
+
+    # Gets the values of many keys at once, None for the missing ones.
+    # The bucket lookup is inlined so that apart from the incremental
+    # rehashing of a resize in progress there is no method call per key
+    def get_many(self, keys):
+        table = self.table
+        mask = self.capacity - 1
+        hash_key = self.hash_key
+        values = []
+        for key in keys:
+            value = None
+            if key is not None:
+                key_hash = hash_key(key)
+                if self.oldTable is not None:
+                    self.migrate(key_hash)
+                bucket = table[key_hash & mask]
+                if bucket is not None:
+                    for entry in bucket:
+                        if entry.hash == key_hash and (entry.key is key or entry.key == key):
+                            value = entry.value
+                            break
+            values.append(value)
+        return values
+
+    # Places many (key, value) pairs in the hash-table. The table is resized
+    # once up front to fit all of them, instead of doubling repeatedly while
+    # they are inserted. Returns the previous values, like put
+    def put_many(self, items):
+        items = list(items)
+        if self.size + len(items) > self.threshold:
+            capacity = self.capacity
+            while int(capacity * self.maxLoadFactor) < self.size + len(items):
+                capacity *= 2
+            self.resizeTable(capacity)
+        self.finish_rehash()
+
+        insert = self.insert
+        return [insert(key, value) for key, value in items]
+
+    # Removes many keys from the map and returns their values, None for the missing ones
+    def remove_many(self, keys):
+        remove = self.remove
+        return [remove(key) for key in keys]
 
     # // Removes an entry from a given bucket if it exists
-    def bucket_remove_entry(self, bucket_index, key):
-        entry = self.bucket_seek_entry(bucket_index, key)
+    def bucket_remove_entry(self, bucket_index, key, key_hash):
+        entry = self.bucket_seek_entry(bucket_index, key, key_hash)
         if entry:
             links = self.table[bucket_index]
             links.remove(entry)
             self.size -= 1
+
+            # Release buckets once the load drops far below maxLoadFactor
+            if self.size < self.threshold // 4 and self.capacity > self.minCapacity:
+                self.resizeTable(max(self.minCapacity, self.capacity // 2))
             return entry.value
         return None
 
     #   // Inserts an entry in a given bucket only if the entry does not already
     #   // exist in the given bucket, but if it does then update the entry value
     def bucket_insert_entry(self, bucket_index, entry):
-        bucket = self.table[bucket_index]
-
-        existent_entry = self.bucket_seek_entry(bucket_index, entry.key)
+        existent_entry = self.bucket_seek_entry(bucket_index, entry.key, entry.hash)
 
         if not existent_entry:
+            bucket = self.table[bucket_index]
+            if bucket is None:
+                self.table[bucket_index] = bucket = []
             bucket.append(entry)
-            if self.size + 1 > self.threshold:
+            self.size += 1
+            if self.size > self.threshold:
                 self.resizeTable()
             return None  # Use null to indicate that there was no previous entry
         else:
@@ -122,61 +263,124 @@ class HashTableSeparateChaining:
             return oldVal
 
     # Finds and returns a particular entry in a given bucket if it exists, returns null otherwise
-    def bucket_seek_entry(self, bucket_index, key):
-        if not key:
+    # The stored hash is compared first so that key equality, which may be
+    # expensive, only runs on entries that are very likely the right one
+    def bucket_seek_entry(self, bucket_index, key, key_hash):
+        if key is None:
             return None
         bucket = self.table[bucket_index]
         if bucket is None:
             return None
         for entry in bucket:
-            if entry.key == key:
+            if entry.hash == key_hash and (entry.key is key or entry.key == key):
                 return entry
         return None
 
-    # Resizes the internal table holding buckets of entries
-    def resizeTable(self):
-        self.capacity *= 2
-        self.threshold = int(self.capacity * self.maxLoadFactor)
-        new_table = []
-
-        for i in range(len(self.table)):
-            if self.table[i]:
-                for entry in self.table[i]:
-                    bucket_index = self.normalizeIndex(entry.hash)
-                    bucket = new_table[bucket_index]
-                    if not bucket:
-                        new_table[bucket_index] = bucket = []
-                    bucket.append(entry)
+    # Resizes the internal table holding buckets of entries (to twice its
+    # capacity by default). Only the new bucket array is allocated here,
+    # the entries are moved over by the following operations, REHASH_STEP
+    # buckets at a time, so no single call pays the full O(n) rehash
+    def resizeTable(self, capacity=None):
+        # A resize still in progress has to be completed first
+        self.finish_rehash()
 
-                self.table[i] = None
+        self.oldTable = self.table
+        self.oldCapacity = self.capacity
+        self.rehashIndex = 0
 
-        self.table = new_table
+        self.capacity = power_of_two(capacity) if capacity is not None else self.capacity * 2
+        self.threshold = int(self.capacity * self.maxLoadFactor)
+        self.table = [None] * self.capacity
+
+    # Makes sure the entry with the given hash, if any, lives in the current
+    # table and advances the resize in progress, amortized O(1)
+    def migrate(self, keyHash):
+        if self.oldTable is not None:
+            self.rehash_bucket(keyHash & (self.oldCapacity - 1))
+            self.rehash_step()
+
+    # Moves every remaining bucket of a resize in progress to the new table
+    def finish_rehash(self):
+        while self.oldTable is not None:
+            self.rehash_step()
+
+    # Moves the next REHASH_STEP buckets of the old table to the new one
+    def rehash_step(self):
+        end = min(self.rehashIndex + REHASH_STEP, self.oldCapacity)
+        for i in range(self.rehashIndex, end):
+            self.rehash_bucket(i)
+        self.rehashIndex = end
+
+        if end == self.oldCapacity:
+            self.oldTable = None
+
+    # Moves every entry of a bucket of the old table to the new one
+    def rehash_bucket(self, old_index):
+        old_bucket = self.oldTable[old_index]
+        if old_bucket is None:
+            return
+        for entry in old_bucket:
+            bucket_index = self.normalizeIndex(entry.hash)
+            bucket = self.table[bucket_index]
+            if bucket is None:
+                self.table[bucket_index] = bucket = []
+            bucket.append(entry)
+        self.oldTable[old_index] = None
 
-    # Returns the list of keys found within the hash table
-    def keys(self):
-        keys = []
+    # Yields every non empty bucket, including those of the old table
+    # that were not moved yet when a resize is in progress. Like the
+    # iterators built on it, it must not be used while the table changes
+    def buckets(self):
         for bucket in self.table:
             if bucket:
-                for entry in bucket:
-                    keys.append(entry.key)
-        return keys
+                yield bucket
+        if self.oldTable is not None:
+            for bucket in self.oldTable:
+                if bucket:
+                    yield bucket
+
+    # Returns the distribution of chain lengths over every bucket, including
+    # those of the old table during a resize: the longest chain, the mean
+    # length of the non empty chains and a histogram mapping each length to
+    # the number of buckets having it. Long chains under a low load factor
+    # mean the hash or mix function spreads the keys badly
+    def chain_stats(self):
+        histogram = {}
+        tables = [self.table] if self.oldTable is None else [self.table, self.oldTable]
+        for table in tables:
+            for bucket in table:
+                length = len(bucket) if bucket else 0
+                histogram[length] = histogram.get(length, 0) + 1
+
+        used = sum(count for length, count in histogram.items() if length > 0)
+        return {
+            'max': max(histogram),
+            'mean': self.size / used if used else 0.0,
+            'histogram': dict(sorted(histogram.items())),
+        }
+
+    # Iterates lazily over the keys found within the hash table
+    def keys(self):
+        for bucket in self.buckets():
+            for entry in bucket:
+                yield entry.key
 
-    # Returns the list of values found within the hash table
+    # Iterates lazily over the values found within the hash table
     def values(self):
-        values = []
-        for bucket in self.table:
-            if bucket:
-                for entry in bucket:
-                    values.append(entry.value)
+        for bucket in self.buckets():
+            for entry in bucket:
+                yield entry.value
 
-        return values
+    # Iterates lazily over the (key, value) pairs found within the hash table
+    def items(self):
+        for bucket in self.buckets():
+            for entry in bucket:
+                yield entry.key, entry.value
 
     def __repr__(self):
         sb = '{'
-        for i in range(len(self.table)):
-            if not self.table[i]:
-                continue
-            for entry in self.table[i]:
+        for bucket in self.buckets():
+            for entry in bucket:
                 sb += f'{entry}, '
         sb += '}'
         return str(sb)
@@ -194,8 +398,19 @@ if __name__ == '__main__':
     print(hash_table.remove('Bobo'))
     print(hash_table.is_empty())
     print(hash_table.get('Otaku'))
-    print(hash_table.keys())
-    print(hash_table.values())
+    print(list(hash_table.keys()))
+    print(list(hash_table.values()))
     print(hash_table.has_key('Cheiroso'))
 
+    hash_table.put_many([('Bobo', 'Jimenez'), ('Linda', 'Sgobero')])
+    print(hash_table.get_many(['Bobo', 'Linda', 'Ninguem']))
+    print(hash_table.remove_many(['Bobo', 'Otaku']))
+
     print(hash_table)
+
+    # Multiples of 1024 only differ in bits the mask throws away
+    sem_mistura = HashTableSeparateChaining(0, DEFAULT_LOAD_FACTOR, mix=identity_mix)
+    misturada = HashTableSeparateChaining(0, DEFAULT_LOAD_FACTOR)
+    sem_mistura.put_many((i * 1024, i) for i in range(1000))
+    misturada.put_many((i * 1024, i) for i in range(1000))
+    print(sem_mistura.chain_stats()['max'], misturada.chain_stats()['max'])
@@ -0,0 +1,260 @@
+import mmap
+import pickle
+import struct
+from array import array
+from hashlib import blake2b
+
+from hash_table_separate_chaining import DEFAULT_CAPACITY, DEFAULT_LOAD_FACTOR, HashTableSeparateChaining
+
+MAGIC = b'HTSC'
+VERSION = 2
+HEADER = struct.Struct('<4sIQQ')  # magic, version, number of buckets, number of entries
+OFFSET = struct.Struct('<Q')  # file offset where a bucket starts
+RECORD = struct.Struct('<QII')  # key hash, key length, value length, followed by the key and value bytes
+LENGTH = struct.Struct('<I')  # length of an encoded str, bytes or int, or number of items of a tuple
+FLOAT = struct.Struct('<d')
+PICKLE_PROTOCOL = 4
+
+
+# Keys are stored in a canonical encoding: a one byte type tag followed by the
+# data, so equal keys always encode to the same bytes no matter how they were
+# built or which process encodes them. Python's hash() of strings changes from
+# one process to the next, so buckets are picked with a hash of these bytes
+# instead. Only str, bytes, int, float, bool and tuples of those can be keys:
+# the pickled form of other types, like sets, depends on the process. Each
+# type has its own tag, so 1, 1.0 and True are different keys here
+def write_key(key, out):
+    key_type = type(key)
+    if key_type is str:
+        data = key.encode('utf-8', 'surrogatepass')
+        out += b's' + LENGTH.pack(len(data)) + data
+    elif key_type is bytes:
+        out += b'b' + LENGTH.pack(len(key)) + key
+    elif key_type is bool:
+        out += b'T' if key else b'F'
+    elif key_type is int:
+        data = key.to_bytes(key.bit_length() // 8 + 1, 'little', signed=True)
+        out += b'i' + LENGTH.pack(len(data)) + data
+    elif key_type is float:
+        # 0.0 == -0.0, so both are written as 0.0
+        out += b'f' + FLOAT.pack(key if key else 0.0)
+    elif key_type is tuple:
+        out += b't' + LENGTH.pack(len(key))
+        for item in key:
+            write_key(item, out)
+    else:
+        raise Exception(f'Keys of type {key_type.__name__} cannot be saved')
+
+
+# Reads back a key written by write_key at a position, returns the key and the
+# position right after it
+def read_key(data, position):
+    tag = data[position:position + 1]
+    position += 1
+    if tag == b'T' or tag == b'F':
+        return tag == b'T', position
+    if tag == b'f':
+        return FLOAT.unpack_from(data, position)[0], position + FLOAT.size
+
+    length, = LENGTH.unpack_from(data, position)
+    position += LENGTH.size
+    if tag == b't':
+        items = []
+        for _ in range(length):
+            item, position = read_key(data, position)
+            items.append(item)
+        return tuple(items), position
+
+    end = position + length
+    if tag == b's':
+        return str(data[position:end], 'utf-8', 'surrogatepass'), end
+    if tag == b'b':
+        return bytes(data[position:end]), end
+    if tag == b'i':
+        return int.from_bytes(data[position:end], 'little', signed=True), end
+    raise Exception(f'Unknown key tag {tag!r}')
+
+
+def encode_key(key):
+    out = bytearray()
+    write_key(key, out)
+    key_bytes = bytes(out)
+    key_hash = int.from_bytes(blake2b(key_bytes, digest_size=8).digest(), 'little')
+    return key_bytes, key_hash
+
+
+def decode_key(key_bytes):
+    return read_key(key_bytes, 0)[0]
+
+
+# A read-only hash table opened straight from a file written by save. The file
+# is memory mapped, a lookup only reads the records of one bucket, and keys and
+# values are decoded only when they are accessed. Processes opening the same
+# file share its pages
+class MappedHashTable:
+    def __init__(self, path):
+        self.file = open(path, 'rb')
+        self.map = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        self.view = memoryview(self.map)
+
+        magic, version, self.bucketCount, self.size = HEADER.unpack_from(self.map, 0)
+        if magic != MAGIC or version != VERSION:
+            self.close()
+            raise Exception(f'{path} is not a saved hash table')
+
+    # Writes the entries of a hash table to a flat file: a header, the
+    # offset where each bucket starts and then the records, bucket by
+    # bucket. Nothing but one offset per bucket is kept in memory: a first
+    # pass over the entries adds up the size of every bucket, a second one
+    # encodes each entry again and writes it straight to its place in the
+    # file. The table must not change while it is being saved
+    @staticmethod
+    def save(table, path, maxLoadFactor=DEFAULT_LOAD_FACTOR):
+        bucket_count = DEFAULT_CAPACITY
+        while bucket_count * maxLoadFactor < table.size:
+            bucket_count *= 2
+
+        # Bucket i spans from offsets[i] to offsets[i + 1]
+        offsets = array('Q', [0]) * (bucket_count + 1)
+        for key, value in table.items():
+            key_bytes, key_hash = encode_key(key)
+            value_bytes = pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+            offsets[key_hash % bucket_count + 1] += RECORD.size + len(key_bytes) + len(value_bytes)
+
+        offsets[0] = HEADER.size + OFFSET.size * (bucket_count + 1)
+        for i in range(1, bucket_count + 1):
+            offsets[i] += offsets[i - 1]
+
+        with open(path, 'wb') as file:
+            file.write(HEADER.pack(MAGIC, VERSION, bucket_count, table.size))
+            for offset in offsets:
+                file.write(OFFSET.pack(offset))
+
+            # The offsets now move forward as the records of each bucket are written
+            for key, value in table.items():
+                key_bytes, key_hash = encode_key(key)
+                value_bytes = pickle.dumps(value, protocol=PICKLE_PROTOCOL)
+                bucket_index = key_hash % bucket_count
+                file.seek(offsets[bucket_index])
+                file.write(RECORD.pack(key_hash, len(key_bytes), len(value_bytes)))
+                file.write(key_bytes)
+                file.write(value_bytes)
+                offsets[bucket_index] += RECORD.size + len(key_bytes) + len(value_bytes)
+
+    # Releases the mapping and the file
+    def close(self):
+        self.view.release()
+        self.map.close()
+        self.file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    # Returns the number of elements inside the hash-table
+    def __len__(self):
+        return self.size
+
+    # Returns true/false depending on whether the hash-table is empty
+    def is_empty(self):
+        return self.size == 0
+
+    # Yields the position and the lengths of every record of a bucket
+    def records(self, bucket_index):
+        start = HEADER.size + OFFSET.size * bucket_index
+        position, end = struct.unpack_from('<QQ', self.map, start)
+        while position < end:
+            key_hash, key_length, value_length = RECORD.unpack_from(self.map, position)
+            yield position + RECORD.size, key_hash, key_length, value_length
+            position += RECORD.size + key_length + value_length
+
+    # Returns where the value of a key starts and ends, None if the key does not exist
+    def seek(self, key):
+        key_bytes, key_hash = encode_key(key)
+        for position, record_hash, key_length, value_length in self.records(key_hash % self.bucketCount):
+            if record_hash == key_hash and self.view[position:position + key_length] == key_bytes:
+                start = position + key_length
+                return start, start + value_length
+        return None
+
+    # Returns true/false depending on whether a key is in the hash table
+    def contains_key(self, key):
+        return self.has_key(key)
+
+    def has_key(self, key):
+        return self.seek(key) is not None
+
+    # Gets a key's value from the map, None if the key does not exist
+    def get(self, key):
+        span = self.seek(key)
+        if span is None:
+            return None
+        return pickle.loads(self.view[span[0]:span[1]])
+
+    # Iterates lazily over the (key, value) pairs found within the hash table
+    def items(self):
+        for bucket_index in range(self.bucketCount):
+            for position, _, key_length, value_length in self.records(bucket_index):
+                value_start = position + key_length
+                yield (decode_key(self.view[position:value_start]),
+                       pickle.loads(self.view[value_start:value_start + value_length]))
+
+    # Iterates lazily over the keys found within the hash table
+    def keys(self):
+        for bucket_index in range(self.bucketCount):
+            for position, _, key_length, _ in self.records(bucket_index):
+                yield decode_key(self.view[position:position + key_length])
+
+    # Iterates lazily over the values found within the hash table
+    def values(self):
+        for _, value in self.items():
+            yield value
+
+    # Loads every entry back into a regular, writable hash table
+    def to_table(self):
+        table = HashTableSeparateChaining(DEFAULT_CAPACITY, DEFAULT_LOAD_FACTOR)
+        table.put_many(self.items())
+        return table
+
+    def __repr__(self):
+        sb = '{'
+        for key, value in self.items():
+            sb += f'{key} => {value}, '
+        sb += '}'
+        return str(sb)
+
+
+if __name__ == '__main__':
+    import os
+    import tempfile
+
+    hash_table = HashTableSeparateChaining(DEFAULT_CAPACITY, DEFAULT_LOAD_FACTOR)
+
+    hash_table.add('Bobo', 'Jimenez')
+    hash_table.add('Linda', 'Nikoly')
+    hash_table.add('Cheiroso', 'Dyogo')
+    hash_table.add(('ab', 'ab'), 'Sarah')
+
+    path = os.path.join(tempfile.mkdtemp(), 'tabela.htsc')
+    MappedHashTable.save(hash_table, path)
+
+    with MappedHashTable(path) as mapped:
+        print(mapped.get('Linda'))
+        print(mapped.has_key('Otaku'))
+        print(len(mapped))
+        print(mapped)
+
+    # A process with another string hash seed finds the same keys, even
+    # when they are built at run time
+    import subprocess
+    import sys
+
+    script = ('import sys\n'
+              'from mapped_hash_table import MappedHashTable\n'
+              'with MappedHashTable(sys.argv[1]) as mapped:\n'
+              '    print(mapped.get("".join(["Li", "nda"])), mapped.get(("a" + "b", "ab")))\n')
+    subprocess.run([sys.executable, '-c', script, path], check=True,
+                   cwd=os.path.dirname(os.path.abspath(__file__)),
+                   env=dict(os.environ, PYTHONHASHSEED='1234'))
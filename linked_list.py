@@ -1,28 +1,71 @@
+import random
+
+MAX_SKIP_LEVEL = 32
+
+
 class Node(object):
     """
-    Internal node class to represent data
+    Internal node class to represent data. The nodes returned by the add
+    methods are handles to their element, valid until it is removed
     """
+    __slots__ = ('data', 'prev', 'next', 'tower')
 
     def __init__(self, data, prev, next):
         self.data = data
         self.prev = prev
         self.next = next
+        self.tower = None  # Skip index links of the levels above 0, None for nodes only on level 0
 
     def __repr__(self):
         return str(self.data)
 
 
+class SkipLink(object):
+    """
+    Internal link of a node on one level of the skip index
+    """
+    __slots__ = ('next', 'prev', 'width')
+
+    def __init__(self, next, prev, width):
+        self.next = next  # Next node having this level, None at the end
+        self.prev = prev  # Previous node having this level, the index header at the start
+        self.width = width  # Number of positions from the node to next (or to the end)
+
+
 class DoublyLinkedList(object):
     """
     Dynamic Array Class (Similar to Python List)
+
+    With a pool_size above 0 the nodes of removed elements are kept in a
+    free list (up to pool_size of them) and reused by the next additions,
+    so a list whose size stays steady stops allocating nodes. A reused
+    node may then hold another element: nodes must not be kept after
+    their element was removed
+
+    With skip_index the nodes also get the towers of an indexable skip
+    list, so addAt, removeAt and get find an index in O(log n) expected
+    time instead of walking from the nearest end. Every addition and
+    removal then costs O(log n) expected time to keep the towers up to date
     """
 
-    def __init__(self):
+    def __init__(self, pool_size=0, skip_index=False):
+        if pool_size < 0:
+            raise Exception(f'pool_size should not be negative. The value of pool_size was {pool_size}')
         self.llSize = 0
         self.head = None
         self.tail = None
         self.travIter = None
 
+        # Free nodes chained through their next pointer
+        self.poolSize = pool_size
+        self.pool = None
+        self.pooled = 0
+
+        # Header of the skip index, standing before the first position
+        self.skipHeader = Node(None, None, None) if skip_index else None
+        if skip_index:
+            self.skipHeader.tower = []
+
     def __len__(self):
         """
         Return number of elements sorted in array
@@ -36,14 +79,15 @@ class DoublyLinkedList(object):
         trav = self.head
         while trav is not None:
             next = trav.next
-            trav.prev = trav.next = None
-            trav.data = None
+            self.release(trav)
             trav = next
 
         self.head = None
         self.tail = None
         trav = None
         self.llSize = 0
+        if self.skipHeader is not None:
+            self.skipHeader.tower = []
 
     def size(self):
         """
@@ -57,60 +101,120 @@ class DoublyLinkedList(object):
         """
         return self.size() == 0
 
+    def new_node(self, data, prev, next):
+        """
+        Return a node from the pool if there is one, a new node otherwise, O(1)
+        """
+        node = self.pool
+        if node is None:
+            node = Node(data, prev, next)
+        else:
+            self.pool = node.next
+            self.pooled -= 1
+            node.data = data
+            node.prev = prev
+            node.next = next
+
+        if self.skipHeader is not None:
+            node.tower = self.new_tower()
+        return node
+
+    def release(self, node):
+        """
+        Clean up a node that left the list and keep it in the pool if there is room, O(1)
+        """
+        node.data = None
+        node.prev = None
+        node.tower = None
+        if self.pooled < self.poolSize:
+            node.next = self.pool
+            self.pool = node
+            self.pooled += 1
+        else:
+            node.next = None
+
     def add(self, elem):
         """
-        Add an element to the tail of the linked list, O(1)
+        Add an element to the tail of the linked list and return its node, O(1)
         """
-        self.addLast(elem)
+        return self.addLast(elem)
 
     def addLast(self, elem):
         """
-        Add a node to the tail of the linked list, O(1)
+        Add a node to the tail of the linked list and return it, O(1)
         """
         if self.is_empty():
-            self.head = self.tail = Node(elem, None, None)
+            self.head = self.tail = self.new_node(elem, None, None)
         else:
-            self.tail.next = Node(elem, self.tail, None)
+            self.tail.next = self.new_node(elem, self.tail, None)
             self.tail = self.tail.next
 
+        if self.skipHeader is not None:
+            self.index_insert(self.tail)
         self.llSize += 1
+        return self.tail
 
     def addFirst(self, elem):
         """
-        Add an element to the beginning of this linked list, O(1)
+        Add an element to the beginning of this linked list and return its node, O(1)
         """
         if self.is_empty():
-            self.head = self.tail = Node(elem, None, None)
+            self.head = self.tail = self.new_node(elem, None, None)
         else:
-            self.head.prev = Node(elem, None, None)
+            self.head.prev = self.new_node(elem, None, self.head)
             self.head = self.head.prev
 
+        if self.skipHeader is not None:
+            self.index_insert(self.head)
         self.llSize += 1
+        return self.head
 
     def addAt(self, index, data):
         """
-        Add an element at a specified index
+        Add an element at a specified index and return its node, O(n), O(log n) with the skip index
         """
         if index < 0:
             raise Exception(f'index should not be negative. The value of index was {index}')
 
         if index == 0:
-            self.addFirst(data)
-            return
+            return self.addFirst(data)
 
         if index == self.llSize:
-            self.addLast(data)
-            return
+            return self.addLast(data)
+
+        return self.insert_after(self.node_at(index - 1), data)
 
-        temp = self.head
-        for i in range(0, index - 1):
-            temp = temp.next
+    def insert_after(self, node, data):
+        """
+        Add an element right after the element of a node and return its node, O(1)
+        """
+        if node is self.tail:
+            return self.addLast(data)
 
-        newNode = Node(data, temp, temp.next)
-        temp.next.prev = newNode
-        temp.next = newNode
+        newNode = self.new_node(data, node, node.next)
+        node.next.prev = newNode
+        node.next = newNode
 
+        if self.skipHeader is not None:
+            self.index_insert(newNode)
         self.llSize += 1
+        return newNode
+
+    def insert_before(self, node, data):
+        """
+        Add an element right before the element of a node and return its node, O(1)
+        """
+        if node is self.head:
+            return self.addFirst(data)
+        return self.insert_after(node.prev, data)
+
+    def get(self, index):
+        """
+        Return the element at a specified index, O(n), O(log n) with the skip index
+        """
+        if index < 0 or index >= self.llSize:
+            raise ValueError("wrong index")
+        return self.node_at(index).data
 
     def peekFirst(self):
         """
@@ -139,8 +243,11 @@ class DoublyLinkedList(object):
 
         # Extract the data at the head and move
         # the head pointer forwards one node
-        data = self.head.data
-        self.head = self.head.next
+        node = self.head
+        if self.skipHeader is not None:
+            self.index_remove(node)
+        data = node.data
+        self.head = node.next
         self.llSize -=1
 
         # if the list is empty set the tail to null
@@ -150,6 +257,7 @@ class DoublyLinkedList(object):
         # Do a memory cleanup of the previus node
         else:
             self.head.prev = None
+        self.release(node)
 
         # Return the data tha was at the first node we just removed
         return data
@@ -165,8 +273,11 @@ class DoublyLinkedList(object):
         # Extract te data at the tail and move
         # the tail pointer backwards one node
 
-        data = self.tail.data
-        self.tail = self.tail.prev
+        node = self.tail
+        if self.skipHeader is not None:
+            self.index_remove(node)
+        data = node.data
+        self.tail = node.prev
         self.llSize -= 1
 
         if self.is_empty():
@@ -175,6 +286,7 @@ class DoublyLinkedList(object):
         # Do a memory clean of the node that was just removed
         else:
             self.tail.next = None
+        self.release(node)
 
         # Return the data that was in the last node we just removed
         return data
@@ -183,12 +295,21 @@ class DoublyLinkedList(object):
         """
         Remove an arbitrary node from the linked list, O(1)
         """
+        return self.remove_node(node)
+
+    def remove_node(self, node):
+        """
+        Remove the element of a node from the linked list and return it, O(1)
+        """
         # if the node to remove is somewhere either at the head or the tail handle those independently
         if node.prev is None:
             return self.removeFirst()
         if node.next is None:
             return self.removeLast()
 
+        if self.skipHeader is not None:
+            self.index_remove(node)
+
         # Make the pointers from the adjacents nodes skip over 'node'
         node.next.prev = node.prev
         node.prev.next = node.next
@@ -196,11 +317,8 @@ class DoublyLinkedList(object):
         # Temporarily store the data we want to return
         data = node.data
 
-        # Memory cleanup
-        node.data = None
-        node.next = None
-        node.prev = None
-        node = None
+        # Memory cleanup, the node may be reused
+        self.release(node)
 
         self.llSize -= 1
 
@@ -208,14 +326,71 @@ class DoublyLinkedList(object):
         return data
 
 
+    def move_to_front(self, node):
+        """
+        Move the element of a node to the beginning of the linked list, O(1)
+        """
+        if node is self.head:
+            return
+        if self.skipHeader is not None:
+            self.index_remove(node)
+
+        # Unlink the node, it is not the head so it has a previous node
+        node.prev.next = node.next
+        if node is self.tail:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        node.prev = None
+        node.next = self.head
+        self.head.prev = node
+        self.head = node
+
+        if self.skipHeader is not None:
+            self.index_insert(node)
+
+    def move_to_back(self, node):
+        """
+        Move the element of a node to the end of the linked list, O(1)
+        """
+        if node is self.tail:
+            return
+        if self.skipHeader is not None:
+            self.index_remove(node)
+
+        # Unlink the node, it is not the tail so it has a next node
+        node.next.prev = node.prev
+        if node is self.head:
+            self.head = node.next
+        else:
+            node.prev.next = node.next
+
+        node.next = None
+        node.prev = self.tail
+        self.tail.next = node
+        self.tail = node
+
+        if self.skipHeader is not None:
+            self.index_insert(node)
+
     def removeAt(self, index):
         """
-        Remove a node at a particular index, O(n)
+        Remove a node at a particular index, O(n), O(log n) with the skip index
         """
         # make sure the index provided is valid
         if index < 0 or index >= self.llSize:
             raise ValueError("wrong index")
 
+        return self.remove_node(self.node_at(index))
+
+    def node_at(self, index):
+        """
+        Return the node at a valid index
+        """
+        if self.skipHeader is not None:
+            return self.index_seek(index)
+
         # Search from the fron of the list
         if index < self.llSize / 2:
             i = 0
@@ -232,7 +407,109 @@ class DoublyLinkedList(object):
                 i -= 1
                 trav = trav.prev
 
-        return self.__remove__(trav)
+        return trav
+
+    def new_tower(self):
+        """
+        Return the skip index links of a new node: a node has a link on
+        level k with probability 1/2^k
+        """
+        height = 0
+        bits = random.getrandbits(MAX_SKIP_LEVEL)
+        while bits & 1:
+            height += 1
+            bits >>= 1
+        if height == 0:
+            return None
+        return [SkipLink(None, None, 0) for _ in range(height)]
+
+    def index_predecessors(self, node):
+        """
+        For every level of the skip index above 0, return the last node
+        having that level at or before a node (the header for the levels
+        no such node has, and for a node of None), with how many positions
+        before the node it is. Walks back and up the towers, O(log n) expected
+        """
+        header = self.skipHeader
+        predecessors = []
+        distance = 0
+        trav = header if node is None else node
+        for level in range(1, len(header.tower) + 1):
+            # Step back on the level below until a node reaches this level
+            while trav is not header and (trav.tower is None or len(trav.tower) < level):
+                if level == 1:
+                    trav = header if trav.prev is None else trav.prev
+                    distance += 1
+                else:
+                    trav = trav.tower[level - 2].prev
+                    distance += trav.tower[level - 2].width
+            predecessors.append((trav, distance))
+        return predecessors
+
+    def index_insert(self, node):
+        """
+        Add a node just linked on level 0 to the skip index, before the
+        size of the list is incremented, O(log n) expected
+        """
+        header = self.skipHeader
+        tower = node.tower or ()
+        while len(header.tower) < len(tower):
+            header.tower.append(SkipLink(None, header, self.llSize + 1))
+
+        for level, (pred, distance) in enumerate(self.index_predecessors(node.prev), 1):
+            link = pred.tower[level - 1]
+            if level <= len(tower):
+                # The node splits the span of its predecessor on this level
+                new = tower[level - 1]
+                new.next = link.next
+                new.prev = pred
+                new.width = link.width - distance
+                if link.next is not None:
+                    link.next.tower[level - 1].prev = node
+                link.next = node
+                link.width = distance + 1
+            else:
+                link.width += 1
+
+    def index_remove(self, node):
+        """
+        Remove a node still linked on level 0 from the skip index, O(log n) expected
+        """
+        tower = node.tower or ()
+        for level, (pred, distance) in enumerate(self.index_predecessors(node.prev), 1):
+            link = pred.tower[level - 1]
+            if level <= len(tower):
+                # The predecessor on this level takes over the span of the node
+                old = tower[level - 1]
+                link.next = old.next
+                link.width += old.width - 1
+                if old.next is not None:
+                    old.next.tower[level - 1].prev = pred
+            else:
+                link.width -= 1
+
+    def index_seek(self, index):
+        """
+        Return the node at a valid index going down the skip index, O(log n) expected
+        """
+        # The header stands at position 0, so the node at index is at index + 1
+        target = index + 1
+        position = 0
+        trav = self.skipHeader
+        for level in range(len(trav.tower), 0, -1):
+            link = trav.tower[level - 1]
+            while link.next is not None and position + link.width <= target:
+                position += link.width
+                trav = link.next
+                link = trav.tower[level - 1]
+
+        if trav is self.skipHeader:
+            trav = self.head
+            position = 1
+        while position < target:
+            trav = trav.next
+            position += 1
+        return trav
 
     def remove(self, object):
         """
@@ -245,7 +522,7 @@ class DoublyLinkedList(object):
             trav = self.head
             while trav is not None:
                 if trav.data is None:
-                    self.__remove__(trav)
+                    self.remove_node(trav)
                     return True
                 trav = trav.next
 
@@ -254,7 +531,7 @@ class DoublyLinkedList(object):
             trav = self.head
             while trav is not None:
                 if object == trav.data:
-                    self.__remove__(trav)
+                    self.remove_node(trav)
                     return True
 
                 trav = trav.next
@@ -350,3 +627,16 @@ if __name__ == '__main__':
     list_test.removeFirst()
     print(list_test)
 
+    indexed = DoublyLinkedList(skip_index=True)
+    for nome in ['Sarah', 'Jefferson', 'Jonas']:
+        indexed.addLast(nome)
+    augusto = indexed.addAt(1, 'Augusto')  # node handle of Augusto
+
+    indexed.insert_after(augusto, 'Vinicius')
+    indexed.move_to_front(augusto)
+    print(indexed)
+    print(indexed.get(2))  # Vinicius
+
+    indexed.remove_node(augusto)
+    print(indexed)
+
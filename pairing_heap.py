@@ -0,0 +1,150 @@
+class Node(object):
+    """
+    Internal node of the pairing heap. Children are kept in a
+    singly linked list going through the sibling references
+    """
+    __slots__ = ('data', 'child', 'sibling')
+
+    def __init__(self, data, child, sibling):
+        self.data = data
+        self.child = child
+        self.sibling = sibling
+
+    def __repr__(self):
+        return str(self.data)
+
+
+class PairingHeap(object):
+    """
+    A mergeable min priority queue with the same surface as PQueue.
+    add, peek and meld are O(1), poll is amortized O(log(n))
+    """
+    def __init__(self):
+        self.heapSize = 0  # The number of elements currently inside the heap
+        self.root = None  # The node holding the smallest element
+
+    def is_empty(self):
+        """
+        Checks if the heap is empty
+        """
+        return self.heapSize == 0
+
+    def size(self):
+        """
+        Return the size of the heap
+        """
+        return self.heapSize
+
+    def clear(self):
+        """
+        Clears everything inside the heap, O(1)
+        """
+        self.root = None
+        self.heapSize = 0
+
+    def peek(self):
+        """
+        Returns the element with the lowest priority,
+        None if the heap is empty, O(1)
+        """
+        if self.is_empty():
+            return None
+        return self.root.data
+
+    def add(self, elem):
+        """
+        Adds an element to the heap, the element must not be null, O(1)
+        """
+        if elem is None:
+            raise Exception('IllegalArgumentException()')
+        self.root = self.link(self.root, Node(elem, None, None))
+        self.heapSize += 1
+
+    def poll(self):
+        """
+        Removes the root of the heap, amortized O(log(n))
+        """
+        if self.is_empty():
+            return None
+        data = self.root.data
+        self.root = self.merge_pairs(self.root.child)
+        self.heapSize -= 1
+        return data
+
+    def meld(self, other):
+        """
+        Moves every element of another pairing heap into this one,
+        leaving the other heap empty, O(1)
+        """
+        if other is self:
+            return
+        self.root = self.link(self.root, other.root)
+        self.heapSize += other.heapSize
+        other.clear()
+
+    def link(self, first, second):
+        """
+        Makes the root with the larger element the leftmost
+        child of the other one and returns the new root
+        """
+        if first is None:
+            return second
+        if second is None:
+            return first
+        if second.data < first.data:
+            first, second = second, first
+        second.sibling = first.child
+        first.child = second
+        return first
+
+    def merge_pairs(self, first):
+        """
+        Two pass pairing of a list of siblings: link them in pairs
+        from left to right, then link the pairs from right to left
+        """
+        pairs = []
+        while first is not None:
+            second = first.sibling
+            if second is None:
+                pairs.append(first)
+                break
+            following = second.sibling
+            first.sibling = second.sibling = None
+            pairs.append(self.link(first, second))
+            first = following
+
+        root = None
+        while pairs:
+            root = self.link(pairs.pop(), root)
+        return root
+
+    def __iter__(self):
+        """
+        Iterates over the elements in no particular order
+        """
+        stack = [self.root] if self.root is not None else []
+        while stack:
+            node = stack.pop()
+            yield node.data
+            if node.child is not None:
+                stack.append(node.child)
+            if node.sibling is not None:
+                stack.append(node.sibling)
+
+    def __repr__(self):
+        return list(self).__repr__()
+
+
+if __name__ == '__main__':
+    pares = PairingHeap()
+    impares = PairingHeap()
+
+    for numero in [8, 2, 6, 4]:
+        pares.add(numero)
+    for numero in [7, 1, 5, 3]:
+        impares.add(numero)
+
+    pares.meld(impares)
+
+    print(pares.size(), impares.is_empty())
+    print([pares.poll() for _ in range(pares.size())])
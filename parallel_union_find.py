@@ -0,0 +1,136 @@
+from array import array
+from multiprocessing import Pool
+
+from union_find import UnionFind
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def forest(uf, touched):
+    """
+    Returns the forest of a union find restricted to the elements in
+    'touched' as two arrays: every non root element and its root
+    """
+    elements = array('i', touched)
+    labels = uf.find_many(elements)
+    children = array('i', (e for e, root in zip(elements, labels) if e != root))
+    roots = array('i', (root for e, root in zip(elements, labels) if e != root))
+    return children, roots
+
+
+def compact_forest(size, p, q):
+    """
+    Unifies the edges (p[i], q[i]) given as NumPy arrays and returns the
+    forest of their endpoints as two arrays: every non root element and
+    its root. When the edges have fewer endpoints than there are elements
+    they are renumbered 0..k-1 first, so the work depends on the number
+    of edges and never grows past the number of elements
+    """
+    if 2 * p.size < size:
+        touched, inverse = np.unique(np.concatenate((p, q)), return_inverse=True)
+        p, q = inverse[:p.size], inverse[p.size:]
+    else:
+        touched = np.arange(size, dtype=np.intc)
+    uf = UnionFind(touched.size)
+    uf.unify_edges(p, q)
+    roots = touched[np.frombuffer(uf.labels(), dtype=np.intc)]
+    moved = roots != touched
+    return touched[moved], roots[moved]
+
+
+def build_shard(shard):
+    """
+    Unifies one shard of the edges and returns its forest over the
+    endpoints of those edges, the only elements it can have moved
+    """
+    size, p, q = shard
+    if np is not None:
+        return compact_forest(size, np.frombuffer(p, dtype=np.intc), np.frombuffer(q, dtype=np.intc))
+
+    uf = UnionFind(size)
+    uf.unify_many(zip(p, q))
+    return forest(uf, set(p).union(q))
+
+
+def merge_pair(pair):
+    """
+    Merges two shard forests into a single forest over the elements of both
+    """
+    size, (children1, roots1), (children2, roots2) = pair
+    uf = UnionFind(size)
+    uf.unify_many(zip(children1, roots1))
+    uf.unify_many(zip(children2, roots2))
+    return forest(uf, set(children1).union(roots1, children2, roots2))
+
+
+def parallel_union_find(size, p, q, workers=4):
+    """
+    Unifies every edge (p[i], q[i]) using a pool of processes. The edges
+    are split into one shard per worker and each worker builds the forest
+    of its shard, which are then merged (see merge_forests)
+    """
+    if len(p) != len(q):
+        raise Exception('Edge endpoint sequences must have the same length')
+    if workers < 1:
+        raise Exception('Workers < 1 is not allowed')
+    p = array('i', p)
+    q = array('i', q)
+
+    step = -(-len(p) // workers) or 1
+    shards = [(size, p[i:i + step], q[i:i + step]) for i in range(0, len(p), step)]
+
+    if workers == 1 or len(shards) <= 1:
+        return merge_forests(size, list(map(build_shard, shards)))
+
+    with Pool(workers) as pool:
+        return merge_forests(size, pool.map(build_shard, shards), pool.map)
+
+
+def merge_forests(size, forests, mapper=map):
+    """
+    Unifies the (child, root) links of every shard forest into a new union
+    find. With NumPy all the links are first merged at once over the
+    elements they touch (compact_forest), otherwise the forests are merged
+    pairwise with 'mapper' (the map of the pool), halving their number
+    every round. Either way only the links of a single forest are applied
+    to the full union find, so the work past its allocation depends on the
+    number of elements the edges touch
+    """
+    uf = UnionFind(size)
+    if not forests:
+        return uf
+
+    if np is not None:
+        children, roots = compact_forest(size, np.concatenate([children for children, _ in forests]),
+                                         np.concatenate([roots for _, roots in forests]))
+        # unify_edges makes passes over all the elements, which only pays
+        # off when the forest links a good part of them
+        if children.size * 4 > size:
+            uf.unify_edges(children, roots)
+        else:
+            uf.unify_many(zip(children.tolist(), roots.tolist()))
+        return uf
+
+    while len(forests) > 1:
+        pairs = [(size, forests[i], forests[i + 1]) for i in range(0, len(forests) - 1, 2)]
+        merged = list(mapper(merge_pair, pairs))
+        if len(forests) % 2:
+            merged.append(forests[-1])
+        forests = merged
+
+    children, roots = forests[0]
+    uf.unify_many(zip(children, roots))
+    return uf
+
+
+if __name__ == '__main__':
+    arestas_p = [0, 2, 4, 6, 1, 5]
+    arestas_q = [1, 3, 5, 7, 2, 6]
+
+    uf = parallel_union_find(9, arestas_p, arestas_q, workers=2)
+
+    print(uf.components())
+    print(uf.members(0))
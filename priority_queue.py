@@ -1,18 +1,65 @@
+import heapq
+from array import array
+
+
 class PQueue(object):
-    def __init__(self):
+    def __init__(self, arity=2, key=None, reverse=False, shrink_factor=0.25, typecode=None):
+        if arity < 2:
+            raise Exception('Arity < 2 is not allowed')
+        if not 0 <= shrink_factor < 1:
+            raise Exception('Illegal shrink_factor')
+        self.arity = arity  # The number of children of each node, 2 for a binary heap
+        self.key = key  # Function computing the priority of an element, the element itself if None
+        self.reverse = reverse  # If True the element with the highest priority is polled first
         self.heapSize = 0  # The number of elements currently inside the heap
         self.heapCapacity = 0  # The internal capacity of the heap
-        self.heap = []  # A dynamic list to track the elements inside the heap
+        # The free slots are released once the size falls below shrinkFactor * capacity, 0 never shrinks
+        self.shrinkFactor = shrink_factor
+        # Numbers are stored unboxed in an array of this type, e.g. 'd' or 'q': the
+        # elements themselves without a key, only the priorities with a key
+        self.typecode = typecode
+        self.heap = self.new_heap()  # A dynamic list to track the elements inside the heap
+        self.priorities = self.new_priorities()  # priorities[i] is the priority of heap[i]
 
     # Checks if the heap is empty
     def is_empty(self):
         return self.heapSize == 0
 
-    # Clears everything inside the heap, O(n)
+    # Clears everything inside the heap by dropping the storage, O(1)
     def clear(self):
-        for i in range(self.heapCapacity):
-            self.heap[i] = None
+        self.heap = self.new_heap()
+        self.priorities = self.new_priorities()
         self.heapSize = 0
+        self.heapCapacity = 0
+
+    # Creates the storage for the elements. Without a key a typecode
+    # stores them in a typed array, so they are polled back as plain
+    # numbers of that type (floats for 'd')
+    def new_heap(self):
+        if self.key is None and self.typecode is not None:
+            return array(self.typecode)
+        return []
+
+    # Creates the storage for the priorities. Without a key the elements
+    # are their own priorities and share the heap storage, so every move
+    # writes a single slot. With a key they are computed once on
+    # insertion and stored apart, in a typed array when a typecode was given
+    def new_priorities(self):
+        if self.key is None:
+            return self.heap
+        if self.typecode is None:
+            return []
+        return array(self.typecode)
+
+    # Releases the free slots at the end of the heap once the size
+    # falls below shrinkFactor * capacity. Every slot is released
+    # at most once after being allocated, so this is amortized O(1)
+    def shrink(self):
+        if self.heapSize < self.shrinkFactor * self.heapCapacity:
+            del self.heap[self.heapSize:]
+            if self.priorities is not self.heap:
+                del self.priorities[self.heapSize:]
+            self.heapCapacity = self.heapSize
 
     # Return the size of the heap
     def size(self):
@@ -42,64 +89,190 @@ class PQueue(object):
     def add(self, elem):
         if elem is None:
             raise Exception('IllegalArgumentException()')
+        self.push(elem, elem if self.key is None else self.key(elem))
+
+    # Places an element with an already computed priority
+    # at the bottom of the heap and swims it up, O(log(n))
+    def push(self, elem, priority):
+        shared = self.priorities is self.heap
         if self.heapSize < self.heapCapacity:
             self.heap[self.heapSize] = elem
+            if not shared:
+                self.priorities[self.heapSize] = priority
         else:
             self.heap.append(elem)
+            if not shared:
+                self.priorities.append(priority)
             self.heapCapacity += 1
-        self.swim(self.heapSize)
         self.heapSize += 1
+        self.swim(self.heapSize - 1)
+
+    # Builds a priority queue out of an iterable of elements using
+    # bottom up heap construction, O(n)
+    @classmethod
+    def from_iterable(cls, elems, **kwargs):
+        pq = cls(**kwargs)
+        pq.add_many(elems)
+        return pq
+
+    # Adds a batch of elements to the priority queue. The elements are
+    # appended in one go and the heap invariant is restored afterwards,
+    # O(n) for large batches and O(k*log(n)) for small ones
+    def add_many(self, elems):
+        elems = list(elems)
+        if any(elem is None for elem in elems):
+            raise Exception('IllegalArgumentException()')
+        start = self.heapSize
+        del self.heap[start:]
+        self.heap.extend(elems)
+        if self.priorities is not self.heap:
+            del self.priorities[start:]
+            self.priorities.extend(elems if self.key is None else map(self.key, elems))
+        self.heapSize = self.heapCapacity = len(self.heap)
+        self.restore_heap(start)
+
+    # Removes the k elements with the lowest priority and returns
+    # them in order, O(k*log(n))
+    def poll_many(self, k):
+        heap = self.heap
+        priorities = self.priorities
+        shared = priorities is heap
+        polled = []
+        for _ in range(min(k, self.heapSize)):
+            polled.append(heap[0])
+            self.heapSize -= 1
+            last = self.heapSize
+            heap[0] = heap[last]
+
+            # Only list slots hold references worth clearing
+            if not shared:
+                heap[last] = None
+                priorities[0] = priorities[last]
+                if self.typecode is None:
+                    priorities[last] = None
+            elif self.typecode is None:
+                heap[last] = None
+            if last > 0:
+                self.sink(0)
+        self.shrink()
+        return polled
+
+    # Restores the heap invariant once the elements from index 'start'
+    # onwards were appended. If more than half of the heap is new it is
+    # cheaper to sink every internal node bottom up, O(n), than to swim
+    # every new element, O(k*log(n))
+    def restore_heap(self, start):
+        if self.heapSize - start > start:
+            for k in range((self.heapSize - 2) // self.arity, -1, -1):
+                self.sink(k)
+        else:
+            for k in range(start, self.heapSize):
+                self.swim(k)
 
-    # Tests if the value of node i <= node j
-    # This method assumes i & j are valid indices, O(1)
+    # Tests if node i should be above node j (the priority of node i
+    # <= node j, or >= when reversed). swim and sink inline this
+    # comparison. This method assumes i & j are valid indices, O(1)
     def less(self, i, j):
-        node1 = self.heap[i]
-        node2 = self.heap[j]
-        return node1 <= node2
+        if self.reverse:
+            return self.priorities[j] <= self.priorities[i]
+        return self.priorities[i] <= self.priorities[j]
 
-    # Perform bottom up node swim, O(log(n))
+    # Perform bottom up node swim. Parents are moved down into the
+    # hole left by node k, which is only written once it reaches its
+    # final position. Returns that position, O(log(n))
     def swim(self, k):
-        # Grab the index of the next parent node WRT to k
-        parent = (k - 1) // 2
+        heap = self.heap
+        priorities = self.priorities
+        reverse = self.reverse
+        arity = self.arity
+        shared = priorities is heap
+        elem = heap[k]
+        priority = priorities[k]
 
         # Keep swimming while we have not reached the
         # root and while we're less than our parent.
-        while k > 0 and self.less(k, parent):
-            # Exchange k with the parent
-            self.swap(parent, k)
+        while k > 0:
+            # Grab the index of the next parent node WRT to k
+            parent = (k - 1) // arity
+            parent_priority = priorities[parent]
+            if (priority <= parent_priority) if reverse else (parent_priority <= priority):
+                break
+
+            # Move the parent down to k
+            if shared:
+                heap[k] = parent_priority
+            else:
+                heap[k] = heap[parent]
+                priorities[k] = parent_priority
             k = parent
 
-            # Grab the index of the next parent node WRT to k
-            parent = (k - 1) // 2
+        heap[k] = elem
+        if not shared:
+            priorities[k] = priority
+        return k
 
-    # Top down node sink, O(log(n))
+    # Top down node sink. Like swim, children are moved up into the
+    # hole and node k is written once. Returns its final position,
+    # O(d*log_d(n))
     def sink(self, k):
-        while True:
-            left = 2 * k + 1  # Left  node
-            right = 2 * k + 2  # Right node
-            smallest = left  # Assume left is the smallest node of the two children
+        heap = self.heap
+        priorities = self.priorities
+        reverse = self.reverse
+        arity = self.arity
+        shared = priorities is heap
+        size = self.heapSize
+        elem = heap[k]
+        priority = priorities[k]
 
-            # Find which is smaller left or right
-            # If right is smaller set smallest to be right
-            if right < self.heapSize and self.less(right, left):
-                smallest = right
+        while True:
+            first = arity * k + 1  # Leftmost child node
 
             # Stop if we're outside the bounds of the tree
-            # or stop early if we cannot sink k anymore
-            if left >= self.heapSize or self.less(k, smallest):
+            if first >= size:
                 break
 
-            # Move down the tree following the smallest node
-            self.swap(smallest, k)
+            # Find which of the children is the smallest, a binary
+            # heap compares its two children directly
+            smallest = first
+            smallest_priority = priorities[first]
+            if arity == 2:
+                right = first + 1
+                if right < size:
+                    right_priority = priorities[right]
+                    if (smallest_priority <= right_priority) if reverse else (right_priority <= smallest_priority):
+                        smallest = right
+                        smallest_priority = right_priority
+            else:
+                for child in range(first + 1, min(first + arity, size)):
+                    child_priority = priorities[child]
+                    if (smallest_priority <= child_priority) if reverse else (child_priority <= smallest_priority):
+                        smallest = child
+                        smallest_priority = child_priority
+
+            # Stop early if we cannot sink k anymore
+            if (smallest_priority <= priority) if reverse else (priority <= smallest_priority):
+                break
+
+            # Move the smallest child up to k and follow it down the tree
+            if shared:
+                heap[k] = smallest_priority
+            else:
+                heap[k] = heap[smallest]
+                priorities[k] = smallest_priority
             k = smallest
 
+        heap[k] = elem
+        if not shared:
+            priorities[k] = priority
+        return k
+
     # Swap two nodes. Assumes i & j are valid, O(1)
     def swap(self, i, j):
-        elem_i = self.heap[i]
-        elem_j = self.heap[j]
-
-        self.heap[i] = elem_j
-        self.heap[j] = elem_i
+        heap = self.heap
+        priorities = self.priorities
+        heap[i], heap[j] = heap[j], heap[i]
+        if priorities is not heap:
+            priorities[i], priorities[j] = priorities[j], priorities[i]
 
     # Removes a particular element in the heap, O(n)
     def remove(self, element):
@@ -119,52 +292,244 @@ class PQueue(object):
             return None
 
         self.heapSize -= 1
+        last = self.heapSize
         removed_data = self.heap[i]
-        self.swap(i, self.heapSize)
 
-        # Obliterate the value
-        self.heap[self.heapSize] = None
+        # Move the last node into the hole and obliterate its old slot
+        self.heap[i] = self.heap[last]
+        if self.priorities is not self.heap:
+            self.heap[last] = None
+            self.priorities[i] = self.priorities[last]
+            if self.typecode is None:
+                self.priorities[last] = None
+        elif self.typecode is None:
+            self.heap[last] = None
+        self.shrink()
 
         # Check if the last element was removed
-        if i == self.heapSize:
+        if i == last:
             return removed_data
-        elem = self.heap[i]
-
-        # Try sinking element
-        self.sink(i)
 
-        # If sinking did not work try swimming
-        if self.heap[i] == elem:
+        # Try sinking element, if sinking did not work try swimming
+        if self.sink(i) == i:
             self.swim(i)
         return removed_data
 
-    # Recursively checks if this heap is a min heap
-    # This method is just for testing purposes to make
+    # Recursively checks if this heap is a min heap (a max heap when
+    # reversed). This method is just for testing purposes to make
     # sure the heap invariant is still being maintained
     # Called this method with k=0 to start at the root
     def is_min_heap(self, k):
         # If we are outside the bounds of the heap return true
         if k >= self.heapSize:
             return True
-        left = 2 * k + 1
-        right = 2 * k + 2
+        first = self.arity * k + 1
+        children = range(first, min(first + self.arity, self.heapSize))
 
         # Make sure that the current node k is less than
-        # both of its children left, and right if they exist
+        # all of its children if they exist
         # return false otherwise to indicate an invalid heap
+        for child in children:
+            if not self.less(k, child):
+                return False
 
-        if left < self.heapSize and not self.less(k, left):
-            return False
-        if right < self.heapSize and not self.less(k, right):
-            return False
-
-        # Recurse on both children to make sure they're also valid heaps
-        return self.is_min_heap(left) and self.is_min_heap(right)
+        # Recurse on all children to make sure they're also valid heaps
+        return all(self.is_min_heap(child) for child in children)
 
     def __repr__(self):
         return self.heap.__repr__()
 
 
+class HeapqPQueue(PQueue):
+    """
+    A min priority queue with the same behaviour as PQueue which
+    delegates add/poll/heapify to the C implemented heapq module.
+    Only remove_at falls back to the pure Python swim/sink, which work
+    directly on the heapq list since the elements are their own priorities
+    """
+    def __init__(self):
+        super().__init__()
+
+    # Removes the root of the heap, O(log(n))
+    def poll(self):
+        if self.is_empty():
+            return None
+        self.heapSize -= 1
+        self.heapCapacity -= 1
+        return heapq.heappop(self.heap)
+
+    # Pushes an element into the heap, O(log(n))
+    def push(self, elem, priority):
+        heapq.heappush(self.heap, elem)
+        self.heapSize += 1
+        self.heapCapacity += 1
+
+    # Adds a batch of elements, rebuilding the heap with heapify when
+    # the batch is larger than the heap, O(n) or O(k*log(n))
+    def add_many(self, elems):
+        elems = list(elems)
+        if any(elem is None for elem in elems):
+            raise Exception('IllegalArgumentException()')
+        if len(elems) > self.heapSize:
+            self.heap.extend(elems)
+            heapq.heapify(self.heap)
+        else:
+            for elem in elems:
+                heapq.heappush(self.heap, elem)
+        self.heapSize = self.heapCapacity = len(self.heap)
+
+    # Removes the k smallest elements and returns them in order, O(k*log(n))
+    def poll_many(self, k):
+        heap = self.heap
+        polled = [heapq.heappop(heap) for _ in range(min(k, self.heapSize))]
+        self.heapSize = self.heapCapacity = len(heap)
+        return polled
+
+    # Removes a node at particular index, O(log(n))
+    def remove_at(self, i):
+        removed_data = super().remove_at(i)
+
+        # heapq expects a list without free slots at the end
+        del self.heap[self.heapSize:]
+        self.heapCapacity = self.heapSize
+        return removed_data
+
+
+class IndexedPQueue(PQueue):
+    def __init__(self, arity=2, key=None, reverse=False, shrink_factor=0.25, typecode=None):
+        super().__init__(arity, key, reverse, shrink_factor, typecode)
+        self.index = {}  # Maps each element to its position inside the heap
+
+    # Clears everything inside the heap, O(1)
+    def clear(self):
+        super().clear()
+        self.index = {}
+
+    # The elements are keys of the index, never stored in a typed array
+    def new_heap(self):
+        return []
+
+    # Creates the storage for the priorities, which are given per
+    # element and so always stored apart from the heap
+    def new_priorities(self):
+        if self.typecode is None:
+            return []
+        return array(self.typecode)
+
+    # Test if an element is in heap, O(1)
+    def contains(self, elem):
+        return elem in self.index
+
+    # Returns the priority of an element in the heap, O(1)
+    def priority(self, elem):
+        if elem not in self.index:
+            raise Exception('NoSuchElementException()')
+        return self.priorities[self.index[elem]]
+
+    # Adds an element to the priority queue. Elements must be
+    # hashable and unique, if no priority is given it is computed
+    # from the element like in PQueue, O(log(n))
+    def add(self, elem, priority=None):
+        if elem is None:
+            raise Exception('IllegalArgumentException()')
+        if elem in self.index:
+            raise Exception('Element already in heap')
+        if priority is None:
+            priority = elem if self.key is None else self.key(elem)
+        self.push(elem, priority)
+
+    # Adds a batch of unique elements with their priorities (computed
+    # from the elements when no priorities are given), O(n) for
+    # large batches and O(k*log(n)) for small ones
+    def add_many(self, elems, priorities=None):
+        elems = list(elems)
+        if priorities is None:
+            priorities = elems if self.key is None else list(map(self.key, elems))
+        else:
+            priorities = list(priorities)
+        if len(priorities) != len(elems) or any(elem is None for elem in elems):
+            raise Exception('IllegalArgumentException()')
+        if len(set(elems)) != len(elems) or any(elem in self.index for elem in elems):
+            raise Exception('Element already in heap')
+        start = self.heapSize
+        del self.heap[start:]
+        del self.priorities[start:]
+        self.heap.extend(elems)
+        self.priorities.extend(priorities)
+        self.index.update(zip(elems, range(start, start + len(elems))))
+        self.heapSize = self.heapCapacity = len(self.heap)
+        self.restore_heap(start)
+
+    # Removes the k elements with the lowest priority and returns
+    # them in order, O(k*log(n))
+    def poll_many(self, k):
+        return [self.remove_at(0) for _ in range(min(k, self.heapSize))]
+
+    # Swims node k and updates the positions of the nodes it moved past, O(log(n))
+    def swim(self, k):
+        top = super().swim(k)
+        self.reindex(top, k)
+        return top
+
+    # Sinks node k and updates the positions of the nodes it moved past, O(d*log_d(n))
+    def sink(self, k):
+        bottom = super().sink(k)
+        self.reindex(k, bottom)
+        return bottom
+
+    # Refreshes the index of every node on the path going up
+    # from 'bottom' to its ancestor 'top', O(log(n))
+    def reindex(self, top, bottom):
+        heap = self.heap
+        index = self.index
+        while bottom > top:
+            index[heap[bottom]] = bottom
+            bottom = (bottom - 1) // self.arity
+        index[heap[top]] = top
+
+    # Swap two nodes keeping the index map in sync. Assumes i & j are valid, O(1)
+    def swap(self, i, j):
+        super().swap(i, j)
+        self.index[self.heap[i]] = i
+        self.index[self.heap[j]] = j
+
+    # Removes a particular element in the heap, O(log(n))
+    def remove(self, element):
+        i = self.index.get(element)
+        if i is None:
+            return False
+        self.remove_at(i)
+        return True
+
+    # Removes a node at particular index, O(log(n))
+    def remove_at(self, i):
+        removed_data = super().remove_at(i)
+        if removed_data is not None:
+            del self.index[removed_data]
+        return removed_data
+
+    # Changes the priority of an element already in the heap, O(log(n))
+    def update_priority(self, elem, priority):
+        if elem not in self.index:
+            raise Exception('NoSuchElementException()')
+        i = self.index[elem]
+        self.priorities[i] = priority
+        self.sink(self.swim(i))
+
+    # Lowers the priority of an element only if the new priority
+    # is smaller than the current one. Returns whether the priority
+    # changed, which is what relaxation in Dijkstra's algorithm needs, O(log(n))
+    def decrease_key(self, elem, priority):
+        if elem not in self.index:
+            raise Exception('NoSuchElementException()')
+        i = self.index[elem]
+        if not priority < self.priorities[i]:
+            return False
+        self.priorities[i] = priority
+        self.sink(self.swim(i))
+        return True
+
+
 if __name__ == '__main__':
     teste = PQueue()
     amigos = PQueue()
@@ -198,3 +563,32 @@ if __name__ == '__main__':
 
     print(amigos)
     print(amigos.contains('Nikoly'))
+
+    numeros = PQueue.from_iterable([7, 2, 9, 4, 1])
+    numeros.add_many([8, 3])
+
+    print(numeros.poll_many(3))
+
+
+    distances = IndexedPQueue()
+
+    distances.add('A', 7)
+    distances.add('B', 3)
+    distances.add('C', 5)
+
+    distances.decrease_key('A', 1)
+    distances.update_priority('B', 9)
+    distances.remove('C')
+
+    print(distances.contains('C'))
+    print(distances.poll(), distances.poll())
+
+    tarefas = PQueue(key=len, reverse=True)
+    tarefas.add_many(['dormir', 'estudar', 'ler'])
+
+    print(tarefas.poll())
+
+    rapida = HeapqPQueue.from_iterable([6, 3, 8, 1])
+    rapida.remove(3)
+
+    print(rapida.poll_many(3))
@@ -4,10 +4,11 @@ from linked_list import DoublyLinkedList
 
 class LinkedQueue(Queue):
     """
-    A linked list implementation of a queue
+    A linked list implementation of a queue. With a pool_size the nodes of
+    polled elements are reused by the next offers (see DoublyLinkedList)
     """
-    def __init__(self):
-        self.list = DoublyLinkedList()
+    def __init__(self, pool_size=0):
+        self.list = DoublyLinkedList(pool_size)
         self.iterList = iter(self.list)
 
     def size(self):
@@ -1,35 +1,73 @@
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 class UnionFind(object):
     def __init__(self, size):
-        if size <= 0:
-            raise Exception('Size <= 0 is not allowed')
+        if size < 0:
+            raise Exception('Size < 0 is not allowed')
         self._size = size  # The number of elements in this union find
-        self._sz = []  # Used to track the size of each of the component
-        self._id = []  # id[i] points to the parent of i, if id[i] = i then i is a root node
+        self._sz = array('i', [1]) * size  # Used to track the size of each of the component, each is originally of size one
+        self._id = array('i', range(size))  # id[i] points to the parent of i, if id[i] = i then i is a root node
+        self._next = array('i', range(size))  # next[i] is the next member of the component of i, as a circular list
         self._numcomponents = size  # Tracks the number of components in the union find
 
-        for i in range(size):
-            self._id.append(i)  # Link to itself (self root)
-            self._sz.append(1)  # Each component is originally of size one
-
     # Find which component/set 'p' belongs to, takes amortized constant time.
     def find(self, p):
+        ids = self._id
+
         # Find the root of the component/set
         root = p
 
-        while root != id[root]:
-            root = id[root]
+        while root != ids[root]:
+            root = ids[root]
 
         #  Compress the path leading back to the root.
         #  Doing this operation is called "path compression"
         #  and is what gives us amortized time complexity.
 
         while p != root:
-            next = id[p]
-            id[p] = root
+            next = ids[p]
+            ids[p] = root
             p = next
 
         return root
 
+    # Find the component/set of every element in 'indices' at once.
+    # The find loop is inlined so there is no method call per element
+    def find_many(self, indices):
+        ids = self._id
+        roots = array('i')
+
+        for p in indices:
+            root = p
+            while root != ids[root]:
+                root = ids[root]
+
+            while p != root:
+                next = ids[p]
+                ids[p] = root
+                p = next
+
+            roots.append(root)
+
+        return roots
+
+    # Add a new element in a component/set of its own and return its
+    # index, amortized O(1) since the arrays over-allocate as they grow
+    def add(self):
+        index = self._size
+        self._id.append(index)
+        self._sz.append(1)
+        self._next.append(index)
+        self._size += 1
+        self._numcomponents += 1
+        return index
+
     # Return whether or not the elements 'p' and
     # 'q' are in the same components/set.
     def connected(self, p, q):
@@ -39,6 +77,23 @@ class UnionFind(object):
     def componentSize(self, p):
         return self._sz[self.find(p)]
 
+    # Return every element of the component/set 'p' belongs to,
+    # O(component size) by walking its circular member list
+    def members(self, p):
+        nexts = self._next
+        members = [p]
+        q = nexts[p]
+        while q != p:
+            members.append(q)
+            q = nexts[q]
+        return members
+
+    # Return the root of every element as a flat array, so that
+    # labels()[i] == find(i). Each find compresses the path it walks,
+    # so the pass over all the elements stays linear
+    def labels(self):
+        return self.find_many(range(self._size))
+
     # Return the number of elements in this UnionFind/Disjoint set
     def size(self):
         return self._size
@@ -49,25 +104,288 @@ class UnionFind(object):
 
     # Unify the components/sets containing elements 'p' and 'q'
     def unify(self, p, q):
-        # These elements are already in the same group!
-        if self.connected(p, q):
-            return
         root1 = self.find(p)
         root2 = self.find(q)
 
+        # These elements are already in the same group!
+        if root1 == root2:
+            return
+
         # Merge smaller component/set into the larger one.
-        if self.sz[root1] < self._sz[root2]:
+        if self._sz[root1] < self._sz[root2]:
             self._sz[root2] += self._sz[root1]
             self._id[root1] = root2
         else:
             self._sz[root1] += self._sz[root2]
             self._id[root2] = root1
 
+        # Swapping the successors of the two roots splices
+        # both circular member lists into a single one
+        self._next[root1], self._next[root2] = self._next[root2], self._next[root1]
+
         # Since the roots found are different we know that the
         # number of components/sets has decreased by one
 
         self._numcomponents -= 1
 
+    # Unify the components/sets of every (p, q) pair in 'pairs'.
+    # Both finds and the union are inlined so a batch of edges
+    # costs no method call per edge
+    def unify_many(self, pairs):
+        ids = self._id
+        sz = self._sz
+        nexts = self._next
+        merged = 0
+
+        for p, q in pairs:
+            root1 = p
+            while root1 != ids[root1]:
+                root1 = ids[root1]
+            while p != root1:
+                next = ids[p]
+                ids[p] = root1
+                p = next
+
+            root2 = q
+            while root2 != ids[root2]:
+                root2 = ids[root2]
+            while q != root2:
+                next = ids[q]
+                ids[q] = root2
+                q = next
+
+            if root1 == root2:
+                continue
+
+            if sz[root1] < sz[root2]:
+                sz[root2] += sz[root1]
+                ids[root1] = root2
+            else:
+                sz[root1] += sz[root2]
+                ids[root2] = root1
+            nexts[root1], nexts[root2] = nexts[root2], nexts[root1]
+            merged += 1
+
+        self._numcomponents -= merged
+
+    # Unify the components/sets of every edge (p[i], q[i]) given as two
+    # NumPy arrays. Instead of one find per edge every root is computed at
+    # once: the trees are flattened by pointer jumping, then the larger root
+    # of each edge still crossing two components is hooked under the
+    # smallest root it touches, until no edge crosses components anymore
+    def unify_edges(self, p, q):
+        if np is None:
+            raise Exception('NumPy is required to unify edge arrays')
+        p = np.asarray(p, dtype=np.intc)
+        q = np.asarray(q, dtype=np.intc)
+        if p.shape != q.shape:
+            raise Exception('Edge endpoint arrays must have the same shape')
+        p = p.ravel()
+        q = q.ravel()
+
+        parent = flatten(np.frombuffer(self._id, dtype=np.intc))
+
+        while p.size:
+            root1 = parent[p]
+            root2 = parent[q]
+
+            # Drop the edges inside a single component, they can never cross again
+            crossing = root1 != root2
+            if not crossing.all():
+                p, q = p[crossing], q[crossing]
+                root1, root2 = root1[crossing], root2[crossing]
+            if not p.size:
+                break
+
+            # Hooking a root under a smaller one can never create a cycle
+            np.minimum.at(parent, np.maximum(root1, root2), np.minimum(root1, root2))
+            parent = flatten(parent)
+
+        self._id = array('i', parent.tobytes())
+        self._sz = array('i', np.bincount(parent, minlength=self._size).astype(np.intc).tobytes())
+        self._next = array('i', member_cycles(parent).tobytes())
+        self._numcomponents = int(np.count_nonzero(parent == np.arange(self._size, dtype=np.intc)))
+
+
+# A union find over arbitrary hashable keys instead of the indices 0..size-1.
+# Keys are mapped to dense indices of an underlying UnionFind the first time
+# they are seen, so elements can keep arriving as a stream
+class KeyedUnionFind(object):
+    def __init__(self, keys=()):
+        self._uf = UnionFind(0)  # The union find over the dense indices
+        self._index = {}  # Maps each key to its dense index
+        self._keys = []  # _keys[i] is the key with dense index i
+        for key in keys:
+            self.add(key)
+
+    # Return the dense index of 'key', adding it in a
+    # component/set of its own if it was never seen, O(1)
+    def add(self, key):
+        index = self._index.get(key)
+        if index is None:
+            index = self._index[key] = self._uf.add()
+            self._keys.append(key)
+        return index
+
+    def __contains__(self, key):
+        return key in self._index
+
+    # Return the dense index of a key already added. Queries never add
+    # keys, so looking up unknown keys does not grow the structure
+    def index_of(self, key):
+        index = self._index.get(key)
+        if index is None:
+            raise Exception(f'Unknown key {key!r}')
+        return index
+
+    # Find the key at the root of the component/set 'p' belongs to
+    def find(self, p):
+        return self._keys[self._uf.find(self.index_of(p))]
+
+    # Return whether or not the keys 'p' and 'q' are in the same
+    # components/set, False if either of them was never added
+    def connected(self, p, q):
+        index = self._index
+        if p not in index or q not in index:
+            return False
+        return self._uf.connected(index[p], index[q])
+
+    # Return the size of the components/set 'p' belongs to
+    def componentSize(self, p):
+        return self._uf.componentSize(self.index_of(p))
+
+    # Return the number of keys seen so far
+    def size(self):
+        return self._uf.size()
+
+    # Returns the number of remaining components/sets
+    def components(self):
+        return self._uf.components()
+
+    # Unify the components/sets containing keys 'p' and 'q'
+    def unify(self, p, q):
+        self._uf.unify(self.add(p), self.add(q))
+
+    # Unify the components/sets of every (p, q) pair of keys in 'pairs'
+    def unify_many(self, pairs):
+        add = self.add
+        self._uf.unify_many((add(p), add(q)) for p, q in pairs)
+
+
+# A union find whose unions can be undone, for "what if" merges and offline
+# dynamic connectivity. find does no path compression, which would destroy
+# the history, so union by size alone keeps every find O(log(n))
+class RollbackUnionFind(UnionFind):
+    def __init__(self, size):
+        super().__init__(size)
+        self._history = []  # The roots hooked under another root, in the order the unions happened
+
+    # Find which component/set 'p' belongs to without compressing the path, O(log(n))
+    def find(self, p):
+        ids = self._id
+        while p != ids[p]:
+            p = ids[p]
+        return p
+
+    # Find the component/set of every element in 'indices' at once, O(log(n)) each
+    def find_many(self, indices):
+        ids = self._id
+        roots = array('i')
+        for p in indices:
+            while p != ids[p]:
+                p = ids[p]
+            roots.append(p)
+        return roots
+
+    # Unify the components/sets containing elements 'p' and 'q', O(log(n))
+    def unify(self, p, q):
+        self.unify_many(((p, q),))
+
+    # Unify the components/sets of every (p, q) pair in 'pairs',
+    # recording each union so that it can be rolled back
+    def unify_many(self, pairs):
+        ids = self._id
+        sz = self._sz
+        nexts = self._next
+        history = self._history
+        merged = 0
+
+        for p, q in pairs:
+            while p != ids[p]:
+                p = ids[p]
+            while q != ids[q]:
+                q = ids[q]
+            if p == q:
+                continue
+
+            # Hook the smaller root under the larger one
+            if sz[p] < sz[q]:
+                p, q = q, p
+            sz[p] += sz[q]
+            ids[q] = p
+            nexts[p], nexts[q] = nexts[q], nexts[p]
+            history.append(q)
+            merged += 1
+
+        self._numcomponents -= merged
+
+    # Vectorized unification would compress every path, so the edges
+    # are unified one pair at a time to keep them in the history
+    def unify_edges(self, p, q):
+        self.unify_many(zip(p, q))
+
+    # Return a checkpoint that rollback can later return to, O(1)
+    def checkpoint(self):
+        return len(self._history)
+
+    # Undo every union made after the checkpoint 'to', O(1) per union
+    def rollback(self, to):
+        if to < 0 or to > len(self._history):
+            raise Exception(f'Invalid checkpoint {to}')
+        ids = self._id
+        sz = self._sz
+        nexts = self._next
+        history = self._history
+
+        while len(history) > to:
+            q = history.pop()
+            p = ids[q]
+            ids[q] = q
+            sz[p] -= sz[q]
+
+            # Swapping the successors again splits the member lists apart
+            nexts[p], nexts[q] = nexts[q], nexts[p]
+            self._numcomponents += 1
+
+
+# Points every element of a parent array straight to its root by
+# repeatedly replacing parents with grandparents (pointer jumping),
+# O(n*log(depth))
+def flatten(parent):
+    while True:
+        grandparent = parent[parent]
+        if np.array_equal(grandparent, parent):
+            return grandparent
+        parent = grandparent
+
+
+# Builds the circular member lists of a flattened parent array: the
+# elements are grouped by root and each one points to the next element
+# of its group, the last one wrapping around to the first
+def member_cycles(parent):
+    if not parent.size:
+        return parent
+    order = np.argsort(parent, kind='stable').astype(np.intc)
+    roots = parent[order]
 
+    last = np.empty(parent.size, dtype=bool)
+    last[:-1] = roots[1:] != roots[:-1]
+    last[-1] = True
+    first = np.roll(last, 1)
 
+    successor = np.roll(order, -1)
+    successor[last] = order[first]
 
+    nexts = np.empty_like(parent)
+    nexts[order] = successor
+    return nexts
@@ -0,0 +1,338 @@
+DEFAULT_CHUNK_SIZE = 64
+
+
+class Chunk(object):
+    """
+    Internal node class holding up to chunk_size consecutive elements
+    """
+    __slots__ = ('items', 'prev', 'next')
+
+    def __init__(self, items, prev, next):
+        self.items = items
+        self.prev = prev
+        self.next = next
+
+    def __repr__(self):
+        return str(self.items)
+
+
+class UnrolledLinkedList(object):
+    """
+    Linked list storing its elements in chunks of up to chunk_size elements
+    instead of one node per element. Scans and index lookups hop from chunk
+    to chunk and do the rest inside the chunk arrays, and the per element
+    overhead is one array slot instead of a whole node. Same API as
+    DoublyLinkedList
+    """
+
+    def __init__(self, chunk_size=DEFAULT_CHUNK_SIZE):
+        if chunk_size < 2:
+            raise Exception(f'chunk_size should be at least 2. The value of chunk_size was {chunk_size}')
+        self.chunkSize = chunk_size
+        self.llSize = 0
+        self.head = None
+        self.tail = None
+
+    def __len__(self):
+        """
+        Return number of elements sorted in array
+        """
+        return self.llSize
+
+    def clear(self):
+        """
+        Empty this linked list, O(n / chunk_size)
+        """
+        trav = self.head
+        while trav is not None:
+            next = trav.next
+            trav.prev = trav.next = None
+            trav.items = None
+            trav = next
+
+        self.head = None
+        self.tail = None
+        self.llSize = 0
+
+    def size(self):
+        """
+        Return the size of this linked list
+        """
+        return self.llSize
+
+    def is_empty(self):
+        """
+        Is this linked list empty?
+        """
+        return self.size() == 0
+
+    def add(self, elem):
+        """
+        Add an element to the tail of the linked list, O(1)
+        """
+        self.addLast(elem)
+
+    def addLast(self, elem):
+        """
+        Add an element to the tail of the linked list, O(1)
+        """
+        if self.tail is None:
+            self.head = self.tail = Chunk([elem], None, None)
+        elif len(self.tail.items) == self.chunkSize:
+            self.tail.next = Chunk([elem], self.tail, None)
+            self.tail = self.tail.next
+        else:
+            self.tail.items.append(elem)
+
+        self.llSize += 1
+
+    def addFirst(self, elem):
+        """
+        Add an element to the beginning of this linked list, O(chunk_size)
+        """
+        if self.head is None:
+            self.head = self.tail = Chunk([elem], None, None)
+        elif len(self.head.items) == self.chunkSize:
+            self.head.prev = Chunk([elem], None, self.head)
+            self.head = self.head.prev
+        else:
+            self.head.items.insert(0, elem)
+
+        self.llSize += 1
+
+    def addAt(self, index, data):
+        """
+        Add an element at a specified index, O(n / chunk_size + chunk_size)
+        """
+        if index < 0:
+            raise Exception(f'index should not be negative. The value of index was {index}')
+        if index > self.llSize:
+            raise Exception(f'index should not exceed the size. The value of index was {index}')
+
+        if index == 0:
+            self.addFirst(data)
+            return
+
+        if index == self.llSize:
+            self.addLast(data)
+            return
+
+        chunk, offset = self.seek(index)
+
+        # A full chunk is split in two halves first
+        if len(chunk.items) == self.chunkSize:
+            self.split(chunk)
+            if offset > len(chunk.items):
+                offset -= len(chunk.items)
+                chunk = chunk.next
+
+        chunk.items.insert(offset, data)
+        self.llSize += 1
+
+    def get(self, index):
+        """
+        Return the element at a specified index, O(n / chunk_size)
+        """
+        if index < 0 or index >= self.llSize:
+            raise ValueError("wrong index")
+        chunk, offset = self.seek(index)
+        return chunk.items[offset]
+
+    def peekFirst(self):
+        """
+        Check the value on the first node if it exists, O(1)
+        """
+        if self.is_empty():
+            raise Exception("Empty list")
+        return self.head.items[0]
+
+    def peekLast(self):
+        """
+        Check the value of the last node if it exists, O(1)
+        """
+        if self.is_empty():
+            raise Exception("Empty List")
+        return self.tail.items[-1]
+
+    def removeFirst(self):
+        """
+        Remove the first value at the head of the linked list, O(chunk_size)
+        """
+        if self.is_empty():
+            raise Exception("Empty list")
+        return self.remove_from(self.head, 0)
+
+    def removeLast(self):
+        """
+        remove the last value at the tail of the linked list, O(1)
+        """
+        if self.is_empty():
+            raise Exception("Empty list")
+        return self.remove_from(self.tail, len(self.tail.items) - 1)
+
+    def removeAt(self, index):
+        """
+        Remove the element at a particular index, O(n / chunk_size + chunk_size)
+        """
+        if index < 0 or index >= self.llSize:
+            raise ValueError("wrong index")
+        chunk, offset = self.seek(index)
+        return self.remove_from(chunk, offset)
+
+    def remove(self, object):
+        """
+        Remove a particular value in the linked list, O(n)
+        """
+        trav = self.head
+        while trav is not None:
+            # The search inside a chunk runs in C
+            try:
+                offset = trav.items.index(object)
+            except ValueError:
+                trav = trav.next
+                continue
+            self.remove_from(trav, offset)
+            return True
+        return False
+
+    def indexOf(self, obj):
+        """
+        Find the index of a particular value in the linked list, O(n)
+        """
+        index = 0
+        trav = self.head
+        while trav is not None:
+            try:
+                return index + trav.items.index(obj)
+            except ValueError:
+                index += len(trav.items)
+                trav = trav.next
+        return -1
+
+    def contains(self, obj):
+        """
+        Check if a value is cointained within the linked list
+        """
+        return self.indexOf(obj) != -1
+
+    def seek(self, index):
+        """
+        Return the chunk holding a valid index and the offset of the index
+        inside it, walking the chunks from the nearest end
+        """
+        # Search from the front of the list
+        if index < self.llSize / 2:
+            trav = self.head
+            while index >= len(trav.items):
+                index -= len(trav.items)
+                trav = trav.next
+            return trav, index
+
+        # Search from the back of the list
+        index = self.llSize - index
+        trav = self.tail
+        while index > len(trav.items):
+            index -= len(trav.items)
+            trav = trav.prev
+        return trav, len(trav.items) - index
+
+    def split(self, chunk):
+        """
+        Move the second half of a chunk to a new chunk right after it, O(chunk_size)
+        """
+        half = len(chunk.items) // 2
+        newChunk = Chunk(chunk.items[half:], chunk, chunk.next)
+        del chunk.items[half:]
+
+        if chunk.next is None:
+            self.tail = newChunk
+        else:
+            chunk.next.prev = newChunk
+        chunk.next = newChunk
+
+    def unlink(self, chunk):
+        """
+        Remove a chunk from the list of chunks, O(1)
+        """
+        if chunk.prev is None:
+            self.head = chunk.next
+        else:
+            chunk.prev.next = chunk.next
+        if chunk.next is None:
+            self.tail = chunk.prev
+        else:
+            chunk.next.prev = chunk.prev
+
+        # Memory cleanup
+        chunk.items = None
+        chunk.prev = chunk.next = None
+
+    def rebalance(self, chunk):
+        """
+        Merge a chunk with a neighbour when both fit in one chunk, otherwise
+        move elements from the fuller one so both end at least half full, O(chunk_size)
+        """
+        if chunk.next is not None:
+            left, right = chunk, chunk.next
+        elif chunk.prev is not None:
+            left, right = chunk.prev, chunk
+        else:
+            return
+
+        if len(left.items) + len(right.items) <= self.chunkSize:
+            left.items.extend(right.items)
+            self.unlink(right)
+            return
+
+        moved = (len(left.items) - len(right.items)) // 2
+        if moved > 0:
+            right.items[:0] = left.items[-moved:]
+            del left.items[-moved:]
+        else:
+            left.items.extend(right.items[:-moved])
+            del right.items[:-moved]
+
+    def remove_from(self, chunk, offset):
+        """
+        Remove the element at an offset of a chunk. A chunk left less than
+        half full is rebalanced with a neighbour, so every chunk but the
+        first and the last stays at least half full
+        """
+        data = chunk.items.pop(offset)
+        self.llSize -= 1
+
+        if not chunk.items:
+            self.unlink(chunk)
+        elif len(chunk.items) < self.chunkSize // 2:
+            self.rebalance(chunk)
+
+        return data
+
+    def __iter__(self):
+        """
+        Iterate over the elements, one chunk hop per chunk_size elements
+        """
+        trav = self.head
+        while trav is not None:
+            yield from trav.items
+            trav = trav.next
+
+    def __repr__(self):
+        return '[ ' + ' <-> '.join(str(data) for data in self) + ' ]'
+
+
+if __name__ == '__main__':
+    list_test = UnrolledLinkedList(4)
+
+    for nome in ['Dyogo', 'Nikoly', 'Jimenez', 'Sarah', 'Jefferson']:
+        list_test.addLast(nome)
+    list_test.addFirst('Jonas')
+    list_test.addAt(3, 'Augusto')
+
+    print(list_test)
+    print(list_test.indexOf('Sarah'))
+    print(list_test.get(3))
+
+    list_test.removeAt(3)
+    list_test.remove('Jonas')
+    print(list_test)